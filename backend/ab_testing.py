@@ -3,7 +3,8 @@ A/B Testing Module
 A/B testing framework for experiments
 """
 
-import random
+import bisect
+import xxhash
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from logger import logger
@@ -26,10 +27,18 @@ class Variant:
 class Experiment:
     """A/B test experiment"""
     
-    def __init__(self, name: str, description: str = ""):
+    def __init__(self, name: str, description: str = "", seed: Optional[int] = None):
         self.name = name
         self.description = description
+        # Per-experiment hash seed so one user is bucketed independently
+        # across experiments
+        self.seed = xxhash.xxh32_intdigest(name.encode()) if seed is None else seed
         self.variants: Dict[str, Variant] = {}
+        # Normalized cumulative weights, parallel to _variant_names
+        self._cum_weights: List[float] = []
+        self._variant_names: List[str] = []
+        # get_results() payload, dropped whenever visitors/conversions change
+        self._results_cache: Optional[Dict[str, Any]] = None
         self.created_at = datetime.now()
         self.started_at = None
         self.ended_at = None
@@ -39,17 +48,34 @@ class Experiment:
         """Add variant to experiment"""
         variant = Variant(name, weight)
         self.variants[name] = variant
+        self._rebuild_weights()
+        self._results_cache = None
+    
+    def _rebuild_weights(self):
+        """Rebuild the cumulative weight table used for assignment"""
+        total = sum(v.weight for v in self.variants.values())
+        self._variant_names = list(self.variants.keys())
+        self._cum_weights = []
+        if total <= 0:
+            return
+        
+        cumulative = 0.0
+        for variant in self.variants.values():
+            cumulative += variant.weight / total
+            self._cum_weights.append(cumulative)
     
     def start(self):
         """Start experiment"""
         self.is_active = True
         self.started_at = datetime.now()
+        self._results_cache = None
         logger.info(f"Experiment started: {self.name}")
     
     def end(self):
         """End experiment"""
         self.is_active = False
         self.ended_at = datetime.now()
+        self._results_cache = None
         logger.info(f"Experiment ended: {self.name}")
     
     def assign_variant(self, user_id: str) -> str:
@@ -57,31 +83,34 @@ class Experiment:
         if not self.is_active or not self.variants:
             return None
         
-        # Seed with user_id for consistency
-        random.seed(hash(user_id) % 2**32)
-        rand = random.random()
+        # Hash user_id into a stable uniform value in [0, 1)
+        rand = xxhash.xxh32_intdigest(user_id.encode(), seed=self.seed) / 4294967296.0
         
-        cumulative = 0
-        for variant_name, variant in self.variants.items():
-            cumulative += variant.weight
-            if rand <= cumulative:
-                return variant_name
+        if not self._cum_weights:
+            return self._variant_names[0]
         
-        return list(self.variants.keys())[0]
+        idx = bisect.bisect_right(self._cum_weights, rand)
+        # Guard against float rounding leaving the last bound just below 1.0
+        return self._variant_names[min(idx, len(self._variant_names) - 1)]
     
     def record_visitor(self, variant_name: str):
         """Record visitor for variant"""
         if variant_name in self.variants:
             self.variants[variant_name].visitors += 1
+            self._results_cache = None
     
     def record_conversion(self, variant_name: str):
         """Record conversion for variant"""
         if variant_name in self.variants:
             self.variants[variant_name].conversions += 1
+            self._results_cache = None
     
     def get_results(self) -> Dict[str, Any]:
         """Get experiment results"""
-        return {
+        if self._results_cache is not None:
+            return self._results_cache
+        
+        self._results_cache = {
             "name": self.name,
             "is_active": self.is_active,
             "variants": {
@@ -93,6 +122,7 @@ class Experiment:
                 for name, variant in self.variants.items()
             }
         }
+        return self._results_cache
 
 
 class ABTestManager:
@@ -101,9 +131,14 @@ class ABTestManager:
     def __init__(self):
         self.experiments: Dict[str, Experiment] = {}
     
-    def create_experiment(self, name: str, description: str = "") -> Experiment:
+    def create_experiment(
+        self,
+        name: str,
+        description: str = "",
+        seed: Optional[int] = None
+    ) -> Experiment:
         """Create new experiment"""
-        experiment = Experiment(name, description)
+        experiment = Experiment(name, description, seed)
         self.experiments[name] = experiment
         return experiment
     
@@ -3,15 +3,17 @@ Analytics Module
 Track and analyze user behavior
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
 from logger import logger
 
 
 class Event:
     """Analytics event"""
     
+    __slots__ = ("event_type", "user_id", "data", "timestamp")
+    
     def __init__(self, event_type: str, user_id: str, data: Dict[str, Any] = None):
         self.event_type = event_type
         self.user_id = user_id
@@ -23,21 +25,21 @@ class AnalyticsEngine:
     """Analytics tracking and analysis"""
     
     def __init__(self, max_events: int = 10000):
-        self.events: List[Event] = []
+        # Bounded deque evicts the oldest event in O(1) once full
+        self.events: deque = deque(maxlen=max_events)
         self.max_events = max_events
         self.event_counts = defaultdict(int)
+        # Event counts sorted by frequency; rebuilt lazily after new events
+        self._top_events_cache: Optional[List[Tuple[str, int]]] = None
     
     def track_event(self, event_type: str, user_id: str, data: Dict[str, Any] = None):
         """Track an event"""
         event = Event(event_type, user_id, data)
         self.events.append(event)
         self.event_counts[event_type] += 1
+        self._top_events_cache = None
         
-        # Remove old events if exceeding limit
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events:]
-        
-        logger.info(f"Event tracked: {event_type} by {user_id}")
+        logger.debug("Event tracked: %s by %s", event_type, user_id)
     
     def get_event_count(self, event_type: str) -> int:
         """Get total count for event type"""
@@ -56,41 +58,49 @@ class AnalyticsEngine:
     
     def get_daily_stats(self, days: int = 7) -> Dict[str, int]:
         """Get daily event statistics"""
-        stats = defaultdict(int)
+        stats = Counter()
         cutoff = datetime.now() - timedelta(days=days)
         
-        for event in self.events:
-            if event.timestamp >= cutoff:
-                date_key = event.timestamp.strftime("%Y-%m-%d")
-                stats[date_key] += 1
+        # Events are stored oldest first, so walk backwards and stop at the
+        # cutoff instead of scanning the whole window
+        for event in reversed(self.events):
+            if event.timestamp < cutoff:
+                break
+            stats[event.timestamp.date()] += 1
         
-        return dict(stats)
+        return {day.isoformat(): stats[day] for day in sorted(stats)}
     
     def get_top_events(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top events by frequency"""
-        return sorted(
-            [
-                {"event_type": name, "count": count}
-                for name, count in self.event_counts.items()
-            ],
-            key=lambda x: x["count"],
-            reverse=True
-        )[:limit]
+        if self._top_events_cache is None:
+            self._top_events_cache = sorted(
+                self.event_counts.items(),
+                key=lambda item: item[1],
+                reverse=True
+            )
+        
+        return [
+            {"event_type": name, "count": count}
+            for name, count in self._top_events_cache[:limit]
+        ]
     
     def get_funnel_analysis(self, events: List[str]) -> Dict[str, Any]:
         """Analyze conversion funnel"""
+        # Single pass over events collecting unique users per event type
+        all_users = set()
+        users_by_event = defaultdict(set)
+        for e in self.events:
+            all_users.add(e.user_id)
+            users_by_event[e.event_type].add(e.user_id)
+        
         result = {
-            "total_users": len(set(e.user_id for e in self.events))
+            "total_users": len(all_users)
         }
         
         for i, event_type in enumerate(events):
-            count = len(set(
-                e.user_id for e in self.events
-                if e.event_type == event_type
-            ))
             result[f"step_{i+1}"] = {
                 "event": event_type,
-                "unique_users": count
+                "unique_users": len(users_by_event.get(event_type, ()))
             }
         
         return result
@@ -98,7 +108,10 @@ class AnalyticsEngine:
     def clear_old_events(self, days: int = 30):
         """Clear events older than specified days"""
         cutoff = datetime.now() - timedelta(days=days)
-        self.events = [e for e in self.events if e.timestamp >= cutoff]
+        self.events = deque(
+            (e for e in self.events if e.timestamp >= cutoff),
+            maxlen=self.max_events
+        )
         logger.info(f"Old events cleared (older than {days} days)")
 
 
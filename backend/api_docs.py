@@ -3,10 +3,11 @@ API Documentation
 Enhanced API documentation with examples
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
-API_ENDPOINTS = {
+API_ENDPOINTS = MappingProxyType({
     "POST /upload": {
         "description": "Upload a PDF file for processing",
         "request_body": {
@@ -61,10 +62,10 @@ API_ENDPOINTS = {
         },
         "status_codes": [200, 404]
     }
-}
+})
 
 
-RESPONSE_STATUS_CODES = {
+RESPONSE_STATUS_CODES = MappingProxyType({
     200: "Request successful",
     400: "Bad request - invalid parameters",
     404: "Resource not found",
@@ -72,15 +73,19 @@ RESPONSE_STATUS_CODES = {
     415: "Unsupported media type",
     429: "Rate limit exceeded",
     500: "Internal server error"
-}
+})
 
 
-def get_api_documentation() -> Dict[str, Any]:
-    """Get complete API documentation"""
-    return {
-        "title": "AI Tutor RAG System API",
-        "version": "1.0.0",
-        "description": "API for PDF-based learning with RAG",
-        "endpoints": API_ENDPOINTS,
-        "status_codes": RESPONSE_STATUS_CODES
-    }
+# Documentation is static, so build it once at import time
+_API_DOCUMENTATION = MappingProxyType({
+    "title": "AI Tutor RAG System API",
+    "version": "1.0.0",
+    "description": "API for PDF-based learning with RAG",
+    "endpoints": API_ENDPOINTS,
+    "status_codes": RESPONSE_STATUS_CODES
+})
+
+
+def get_api_documentation() -> Mapping[str, Any]:
+    """Get complete API documentation (read-only)"""
+    return _API_DOCUMENTATION
@@ -3,6 +3,8 @@ Batch Processing Module
 Process items in batches for efficiency
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Callable, Any, Optional
 from datetime import datetime
 from logger import logger
@@ -11,15 +13,20 @@ from logger import logger
 class BatchProcessor:
     """Process items in batches with optimizations"""
     
+    # Shared pool for running sync processor functions in parallel
+    _executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="batch")
+    
     def __init__(
         self,
         batch_size: int = 100,
         max_wait_ms: int = 5000,
-        enable_parallel: bool = True
+        enable_parallel: bool = True,
+        max_concurrency: int = 10
     ):
         self.batch_size = batch_size
         self.max_wait_ms = max_wait_ms
         self.enable_parallel = enable_parallel
+        self.max_concurrency = max_concurrency
         self.items: List[Any] = []
         self.last_process_time = datetime.now()
         self.processed_count = 0
@@ -45,23 +52,34 @@ class BatchProcessor:
         if not self.items:
             return []
         
-        batch = self.items.copy()
-        self.items.clear()
+        # Swap in a fresh list rather than copying pending items
+        batch, self.items = self.items, []
         self.last_process_time = datetime.now()
         
         try:
-            import asyncio
-            
             if self.enable_parallel and len(batch) > 1:
                 # Process items in parallel
                 if asyncio.iscoroutinefunction(processor_func):
-                    tasks = [processor_func(item) for item in batch]
+                    # Bound fan-out so large batches don't flood downstream services
+                    semaphore = asyncio.Semaphore(self.max_concurrency)
+                    
+                    async def run(item):
+                        async with semaphore:
+                            return await processor_func(item)
+                    
+                    tasks = [run(item) for item in batch]
                     result = await asyncio.gather(*tasks, return_exceptions=True)
                     # Filter out exceptions
                     result = [r for r in result if not isinstance(r, Exception)]
                 else:
-                    # Sequential processing for sync functions
-                    result = [processor_func(item) for item in batch]
+                    # Run sync functions on the shared thread pool
+                    loop = asyncio.get_running_loop()
+                    tasks = [
+                        loop.run_in_executor(self._executor, processor_func, item)
+                        for item in batch
+                    ]
+                    result = await asyncio.gather(*tasks, return_exceptions=True)
+                    result = [r for r in result if not isinstance(r, Exception)]
             else:
                 # Process as single batch
                 if asyncio.iscoroutinefunction(processor_func):
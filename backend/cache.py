@@ -3,61 +3,96 @@ Cache Module
 In-memory caching for performance optimization
 """
 
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
-import hashlib
+from typing import Any, Callable, Dict, Optional, Tuple
+from collections import OrderedDict
+import functools
+import pickle
+import threading
+import time
+import xxhash
 
 
-class CacheEntry:
-    """Cache entry with timestamp and TTL"""
-    
-    def __init__(self, value: Any, ttl_seconds: int = 3600):
-        self.value = value
-        self.created_at = datetime.now()
-        self.ttl_seconds = ttl_seconds
-    
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired"""
-        expiry_time = self.created_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.now() > expiry_time
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
 
 
 class Cache:
-    """Simple in-memory cache with TTL support"""
+    """Simple in-memory LRU cache with TTL support"""
     
-    def __init__(self):
-        self._cache: Dict[str, CacheEntry] = {}
+    def __init__(self, max_size: int = 1000):
+        # Entries are (expires_at, value) tuples in least-recently-used order
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Event] = {}
     
     def set(self, key: str, value: Any, ttl_seconds: int = 3600):
         """Set cache value"""
-        self._cache[key] = CacheEntry(value, ttl_seconds)
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl_seconds, value)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, default: Any = None) -> Optional[Any]:
         """Get cache value"""
-        if key not in self._cache:
-            return None
-        
-        entry = self._cache[key]
-        if entry.is_expired():
-            del self._cache[key]
-            return None
-        
-        return entry.value
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._cache[key]
+                return default
+            
+            self._cache.move_to_end(key)
+            return value
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any], ttl_seconds: int = 3600) -> Any:
+        """Get cache value, computing it once if concurrent callers miss together"""
+        while True:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            
+            with self._lock:
+                event = self._inflight.get(key)
+                is_owner = event is None
+                if is_owner:
+                    event = self._inflight[key] = threading.Event()
+            
+            if not is_owner:
+                # Another caller is computing this key; re-check once it finishes
+                event.wait()
+                continue
+            
+            try:
+                value = compute()
+                self.set(key, value, ttl_seconds)
+                return value
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+                event.set()
     
     def delete(self, key: str):
         """Delete cache entry"""
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            self._cache.pop(key, None)
     
     def clear(self):
         """Clear all cache entries"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
     
     def cleanup_expired(self):
         """Remove all expired entries"""
-        expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-        for key in expired_keys:
-            del self._cache[key]
+        now = time.monotonic()
+        with self._lock:
+            expired_keys = [k for k, (expires_at, _) in self._cache.items() if now > expires_at]
+            for key in expired_keys:
+                del self._cache[key]
 
 
 # Global cache instance
@@ -66,22 +101,25 @@ _global_cache = Cache()
 
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
-    key_str = str(args) + str(sorted(kwargs.items()))
-    return hashlib.md5(key_str.encode()).hexdigest()
+    # Keys only need to be uniform, not collision resistant, so use a
+    # non-cryptographic hash over the pickled arguments
+    items = tuple(sorted(kwargs.items()))
+    try:
+        payload = pickle.dumps((args, items), protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Unpicklable arguments (locks, lambdas, ...) fall back to repr
+        payload = (repr(args) + repr(items)).encode()
+    return xxhash.xxh64_hexdigest(payload)
 
 
 def cache_result(ttl_seconds: int = 3600):
     """Decorator to cache function results"""
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             key = cache_key(func.__name__, *args, **kwargs)
-            cached = _global_cache.get(key)
-            
-            if cached is not None:
-                return cached
-            
-            result = func(*args, **kwargs)
-            _global_cache.set(key, result, ttl_seconds)
-            return result
+            return _global_cache.get_or_compute(
+                key, lambda: func(*args, **kwargs), ttl_seconds
+            )
         return wrapper
     return decorator
@@ -4,7 +4,8 @@ Prevent cascading failures
 """
 
 from typing import Callable, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+import time
 from enum import Enum
 from logger import logger
 
@@ -33,6 +34,8 @@ class CircuitBreaker:
         self.failure_count = 0
         self.success_count = 0
         self.last_failure_time = None
+        # Monotonic clock reading of the last failure, used for reset timing
+        self._last_failure_monotonic: Optional[float] = None
         self.last_state_change = datetime.now()
     
     def call(self, func: Callable, *args, **kwargs) -> Optional[Any]:
@@ -49,13 +52,14 @@ class CircuitBreaker:
             result = func(*args, **kwargs)
             self._on_success()
             return result
-        except Exception as e:
+        except Exception:
             self._on_failure()
             raise
     
     def _on_success(self):
         """Handle successful call"""
-        self.failure_count = 0
+        if self.failure_count:
+            self.failure_count = 0
         
         if self.state == CircuitState.HALF_OPEN:
             self.success_count += 1
@@ -65,6 +69,7 @@ class CircuitBreaker:
     def _on_failure(self):
         """Handle failed call"""
         self.failure_count += 1
+        self._last_failure_monotonic = time.monotonic()
         self.last_failure_time = datetime.now()
         
         if self.failure_count >= self.failure_threshold:
@@ -87,10 +92,10 @@ class CircuitBreaker:
     
     def _should_attempt_reset(self) -> bool:
         """Check if should attempt reset"""
-        if self.last_failure_time is None:
+        if self._last_failure_monotonic is None:
             return False
         
-        elapsed = (datetime.now() - self.last_failure_time).total_seconds()
+        elapsed = time.monotonic() - self._last_failure_monotonic
         return elapsed >= self.recovery_timeout
     
     def get_state(self) -> dict:
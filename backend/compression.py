@@ -4,25 +4,60 @@ Data compression utilities with response compression support
 """
 
 import gzip
+import threading
 import zlib
-from typing import Tuple
+import zstandard as zstd
+from typing import Dict, Optional, Tuple
 from logger import logger
 from starlette.middleware.gzip import GZipMiddleware
 
 
+# ZstdCompressor/ZstdDecompressor instances are reusable but must not be
+# shared between threads, so keep one set per thread
+_zstd_local = threading.local()
+
+
+def _get_zstd_compressor(level: int) -> zstd.ZstdCompressor:
+    """Get this thread's reusable zstd compressor for a level"""
+    compressors = getattr(_zstd_local, "compressors", None)
+    if compressors is None:
+        compressors = _zstd_local.compressors = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        compressor = compressors[level] = zstd.ZstdCompressor(level=level)
+    return compressor
+
+
+def _get_zstd_decompressor() -> zstd.ZstdDecompressor:
+    """Get this thread's reusable zstd decompressor"""
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstd.ZstdDecompressor()
+    return decompressor
+
+
 class Compressor:
     """Data compression utilities"""
     
     # Minimum response size for compression (bytes)
     MIN_SIZE_FOR_COMPRESSION = 1000
     
+    # wbits value selecting a gzip header/trailer around the deflate stream
+    GZIP_WBITS = 16 + zlib.MAX_WBITS
+    
+    # Content-Encodings we can produce, most preferred first
+    SUPPORTED_ENCODINGS = ("zstd", "gzip")
+    
     @staticmethod
-    def compress_gzip(data: bytes) -> Tuple[bool, bytes]:
+    def compress_gzip(data: bytes, level: int = 6) -> Tuple[bool, bytes]:
         """Compress data using gzip"""
+        if len(data) < Compressor.MIN_SIZE_FOR_COMPRESSION:
+            return False, data
         try:
-            compressed = gzip.compress(data, compresslevel=9)
-            ratio = (1 - len(compressed) / len(data)) * 100 if data else 0
-            logger.info(f"Gzip compression: {ratio:.1f}% reduction")
+            # A raw compressobj skips the GzipFile/BytesIO wrapper gzip.compress
+            # builds on every call
+            compressor = zlib.compressobj(level, zlib.DEFLATED, Compressor.GZIP_WBITS)
+            compressed = compressor.compress(data) + compressor.flush()
             return True, compressed
         except Exception as e:
             logger.error(f"Gzip compression failed: {str(e)}")
@@ -41,10 +76,10 @@ class Compressor:
     @staticmethod
     def compress_zlib(data: bytes, level: int = 6) -> Tuple[bool, bytes]:
         """Compress data using zlib"""
+        if len(data) < Compressor.MIN_SIZE_FOR_COMPRESSION:
+            return False, data
         try:
             compressed = zlib.compress(data, level=level)
-            ratio = (1 - len(compressed) / len(data)) * 100 if data else 0
-            logger.info(f"Zlib compression: {ratio:.1f}% reduction")
             return True, compressed
         except Exception as e:
             logger.error(f"Zlib compression failed: {str(e)}")
@@ -60,6 +95,70 @@ class Compressor:
             logger.error(f"Zlib decompression failed: {str(e)}")
             return False, data
     
+    @staticmethod
+    def compress_zstd(data: bytes, level: int = 3) -> Tuple[bool, bytes]:
+        """Compress data using zstd"""
+        if len(data) < Compressor.MIN_SIZE_FOR_COMPRESSION:
+            return False, data
+        try:
+            compressed = _get_zstd_compressor(level).compress(data)
+            return True, compressed
+        except Exception as e:
+            logger.error(f"Zstd compression failed: {str(e)}")
+            return False, data
+    
+    @staticmethod
+    def decompress_zstd(data: bytes) -> Tuple[bool, bytes]:
+        """Decompress zstd data"""
+        try:
+            decompressed = _get_zstd_decompressor().decompress(data)
+            return True, decompressed
+        except Exception as e:
+            logger.error(f"Zstd decompression failed: {str(e)}")
+            return False, data
+    
+    @staticmethod
+    def _parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+        """Map each Accept-Encoding coding to its q-value"""
+        weights = {}
+        for token in accept_encoding.split(","):
+            coding, _, params = token.partition(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            q = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            weights[coding] = q
+        return weights
+    
+    @staticmethod
+    def select_encoding(accept_encoding: str) -> Optional[str]:
+        """Pick the highest-weighted Content-Encoding a client accepts"""
+        weights = Compressor._parse_accept_encoding(accept_encoding)
+        wildcard = weights.get("*", 0.0)
+        best, best_q = None, 0.0
+        # SUPPORTED_ENCODINGS is in preference order, so zstd wins ties
+        for encoding in Compressor.SUPPORTED_ENCODINGS:
+            q = weights.get(encoding, wildcard)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+    
+    @staticmethod
+    def compress_for_encoding(data: bytes, encoding: str) -> Tuple[bool, bytes]:
+        """Compress data for a Content-Encoding chosen by select_encoding"""
+        if encoding == "zstd":
+            return Compressor.compress_zstd(data)
+        if encoding == "gzip":
+            return Compressor.compress_gzip(data)
+        return False, data
+    
     @staticmethod
     def get_compression_ratio(original_size: int, compressed_size: int) -> float:
         """Calculate compression ratio"""
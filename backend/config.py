@@ -4,57 +4,70 @@ Handles environment variables and app settings
 """
 
 import os
+from dataclasses import dataclass, field
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+def _env(name: str, default: str = ""):
+    """Build a dataclass default factory reading an environment variable"""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+def _env_int(name: str, default: int):
+    """Build a dataclass default factory reading an integer environment variable"""
+    return field(default_factory=lambda: int(os.getenv(name, default)))
+
+
+@dataclass(frozen=True)
 class Config:
-    """Application configuration"""
+    """Application configuration (environment is read once, at construction)"""
     
     # OpenRouter API
-    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
-    OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+    OPENROUTER_API_KEY: str = _env("OPENROUTER_API_KEY")
+    OPENROUTER_API_URL: str = "https://openrouter.ai/api/v1/chat/completions"
     
     # Model settings
-    MODEL_NAME = os.getenv(
+    MODEL_NAME: str = _env(
         "MODEL_NAME", 
         "mistralai/mistral-small-3.2-24b-instruct:free"
     )
     
     # Server settings
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", 8000))
+    HOST: str = _env("HOST", "0.0.0.0")
+    PORT: int = _env_int("PORT", 8000)
     
     # CORS settings
-    ALLOWED_ORIGINS = os.getenv(
+    ALLOWED_ORIGINS: Tuple[str, ...] = field(default_factory=lambda: tuple(os.getenv(
         "ALLOWED_ORIGINS",
-        "http://localhost:3000,http://localhost:5173,http://127.0.0.1:5500"
-    ).split(",")
+        "http://localhost:3000,http://localhost:5173,http://localhost:5500,"
+        "http://127.0.0.1:3000,http://127.0.0.1:5500"
+    ).split(",")))
     
     # Paths
-    CHUNKS_FILE = "data/chunks.json"
-    IMAGE_METADATA_FILE = "data/image_metadata.json"
-    EMBEDDINGS_DIR = "data/embeddings"
-    UPLOAD_DIR = "data/uploads"
+    CHUNKS_FILE: str = "data/chunks.json"
+    IMAGE_METADATA_FILE: str = "data/image_metadata.json"
+    EMBEDDINGS_DIR: str = "data/embeddings"
+    UPLOAD_DIR: str = "data/uploads"
     
     # RAG settings
-    TOP_K_CHUNKS = 3  # Number of chunks to retrieve
-    TOP_K_IMAGES = 1  # Number of images to retrieve
+    TOP_K_CHUNKS: int = 3  # Number of chunks to retrieve
+    TOP_K_IMAGES: int = 1  # Number of images to retrieve
     
     # File upload settings
-    MAX_FILE_SIZE_MB = 50  # Maximum PDF size in MB
-    ALLOWED_EXTENSIONS = ['.pdf']
+    MAX_FILE_SIZE_MB: int = 50  # Maximum PDF size in MB
+    ALLOWED_EXTENSIONS: Tuple[str, ...] = ('.pdf',)
     
     # Request timeout settings
-    REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 30))  # seconds
-    OPENROUTER_TIMEOUT = int(os.getenv("OPENROUTER_TIMEOUT", 60))  # seconds
+    REQUEST_TIMEOUT: int = _env_int("REQUEST_TIMEOUT", 30)  # seconds
+    OPENROUTER_TIMEOUT: int = _env_int("OPENROUTER_TIMEOUT", 60)  # seconds
     
-    @classmethod
-    def validate(cls):
+    def validate(self):
         """Validate required configuration"""
-        if not cls.OPENROUTER_API_KEY:
+        if not self.OPENROUTER_API_KEY:
             print("⚠️  WARNING: OPENROUTER_API_KEY not set!")
             print("   Please create a .env file with your API key")
             print("   Get your key at: https://openrouter.ai/keys")
@@ -4,81 +4,209 @@ Handles database connections and operations
 """
 
 import sqlite3
-from typing import Any, List, Dict, Optional
+import threading
+from collections import deque
+from typing import Any, Iterable, List, Dict, Optional
 from contextlib import contextmanager
 
 
+# Applied once to every pooled connection when it is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+# Schema created on startup, applied as a single transaction
+SCHEMA_SQL = '''
+BEGIN;
+
+-- PDF metadata table
+CREATE TABLE IF NOT EXISTS pdf_metadata (
+    id INTEGER PRIMARY KEY,
+    filename TEXT UNIQUE NOT NULL,
+    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    file_size INTEGER,
+    page_count INTEGER,
+    status TEXT DEFAULT 'processing'
+);
+
+-- Text chunks table
+CREATE TABLE IF NOT EXISTS text_chunks (
+    id INTEGER PRIMARY KEY,
+    chunk_id TEXT UNIQUE NOT NULL,
+    pdf_filename TEXT NOT NULL,
+    page_number INTEGER,
+    content TEXT NOT NULL,
+    FOREIGN KEY (pdf_filename) REFERENCES pdf_metadata(filename)
+);
+
+-- Images table
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    image_id TEXT UNIQUE NOT NULL,
+    pdf_filename TEXT NOT NULL,
+    page_number INTEGER,
+    image_path TEXT NOT NULL,
+    FOREIGN KEY (pdf_filename) REFERENCES pdf_metadata(filename)
+);
+
+-- Lookups are by source PDF (and page), never by surrogate id
+CREATE INDEX IF NOT EXISTS idx_text_chunks_pdf_page
+ON text_chunks(pdf_filename, page_number);
+
+CREATE INDEX IF NOT EXISTS idx_images_pdf_page
+ON images(pdf_filename, page_number);
+
+COMMIT;
+'''
+
+# Compiled statements kept per connection; reusing the exact SQL text of a
+# cached statement skips SQLite's prepare step
+STATEMENT_CACHE_SIZE = 256
+
+# Fixed read queries addressable by name through execute_prepared
+PREPARED_QUERIES = {
+    "chunks_by_pdf": (
+        "SELECT chunk_id, page_number, content FROM text_chunks "
+        "WHERE pdf_filename = ? ORDER BY page_number"
+    ),
+    "images_by_pdf": (
+        "SELECT image_id, page_number, image_path FROM images "
+        "WHERE pdf_filename = ? ORDER BY page_number"
+    ),
+    "pdf_by_filename": (
+        "SELECT filename, upload_time, file_size, page_count, status "
+        "FROM pdf_metadata WHERE filename = ?"
+    ),
+}
+
+
 class DatabaseConnection:
-    """SQLite database connection manager"""
+    """SQLite database connection manager (one writer, pooled readers)"""
     
-    def __init__(self, db_path: str = "app_data.db"):
+    def __init__(self, db_path: str = "app_data.db", read_pool_size: int = 4):
         """Initialize database connection"""
         self.db_path = db_path
+        self._prepared: Dict[str, str] = dict(PREPARED_QUERIES)
+        
+        # Single long-lived writer; SQLite serializes writes anyway
+        self._writer = self._connect()
+        self._writer_lock = threading.Lock()
+        
+        # Readers are opened lazily and returned to the pool after use.
+        # An in-memory database is private to its connection, so it is
+        # always served by the writer.
+        self._read_pool_size = 0 if db_path == ":memory:" else read_pool_size
+        self._readers: deque = deque()
+        self._readers_available = threading.Semaphore(max(self._read_pool_size, 1))
+        self._readers_lock = threading.Lock()
+        
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection and apply the connection pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
     def _init_database(self):
         """Initialize database tables"""
+        # One script, one transaction: a single parse and a single commit
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # PDF metadata table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS pdf_metadata (
-                    id INTEGER PRIMARY KEY,
-                    filename TEXT UNIQUE NOT NULL,
-                    upload_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    file_size INTEGER,
-                    page_count INTEGER,
-                    status TEXT DEFAULT 'processing'
-                )
-            ''')
-            
-            # Text chunks table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS text_chunks (
-                    id INTEGER PRIMARY KEY,
-                    chunk_id TEXT UNIQUE NOT NULL,
-                    pdf_filename TEXT NOT NULL,
-                    page_number INTEGER,
-                    content TEXT NOT NULL,
-                    FOREIGN KEY (pdf_filename) REFERENCES pdf_metadata(filename)
-                )
-            ''')
-            
-            # Images table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS images (
-                    id INTEGER PRIMARY KEY,
-                    image_id TEXT UNIQUE NOT NULL,
-                    pdf_filename TEXT NOT NULL,
-                    page_number INTEGER,
-                    image_path TEXT NOT NULL,
-                    FOREIGN KEY (pdf_filename) REFERENCES pdf_metadata(filename)
-                )
-            ''')
-            
-            conn.commit()
+            conn.executescript(SCHEMA_SQL)
     
     @contextmanager
     def get_connection(self):
-        """Get database connection context manager"""
-        conn = sqlite3.connect(self.db_path)
+        """Get the writer connection context manager"""
+        with self._writer_lock:
+            yield self._writer
+    
+    @contextmanager
+    def get_read_connection(self):
+        """Check a reader connection out of the pool"""
+        if not self._read_pool_size:
+            with self.get_connection() as conn:
+                yield conn
+            return
+        
+        self._readers_available.acquire()
         try:
-            yield conn
+            with self._readers_lock:
+                conn = self._readers.popleft() if self._readers else None
+            if conn is None:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                with self._readers_lock:
+                    self._readers.append(conn)
         finally:
-            conn.close()
+            self._readers_available.release()
+    
+    def close(self):
+        """Close all pooled connections"""
+        with self._readers_lock:
+            while self._readers:
+                self._readers.popleft().close()
+        with self._writer_lock:
+            self._writer.close()
     
     def execute_query(self, query: str, params: tuple = ()) -> List[Any]:
         """Execute SELECT query"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            return cursor.fetchall()
+        with self.get_read_connection() as conn:
+            return conn.execute(query, params).fetchall()
+    
+    def register_query(self, name: str, query: str):
+        """Register a fixed query for execute_prepared"""
+        self._prepared[name] = query
+    
+    def execute_prepared(self, name: str, params: tuple = ()) -> List[Any]:
+        """Execute a registered SELECT query by name"""
+        query = self._prepared.get(name)
+        if query is None:
+            raise KeyError(f"Unknown prepared query: {name}")
+        return self.execute_query(query, params)
     
     def execute_update(self, query: str, params: tuple = ()) -> int:
         """Execute INSERT/UPDATE/DELETE query"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            conn.commit()
-            return cursor.rowcount
+            return conn.execute(query, params).rowcount
+    
+    def execute_many(self, query: str, seq_of_params: Iterable[tuple]) -> int:
+        """Execute INSERT/UPDATE/DELETE query for many rows in one transaction"""
+        with self.get_connection() as conn:
+            # Take the write lock up front so the batch never has to upgrade
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rowcount = conn.executemany(query, seq_of_params).rowcount
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return rowcount
+    
+    def insert_text_chunks(self, chunks: Iterable[tuple]) -> int:
+        """Bulk insert (chunk_id, pdf_filename, page_number, content) rows"""
+        return self.execute_many(
+            "INSERT INTO text_chunks (chunk_id, pdf_filename, page_number, content) "
+            "VALUES (?, ?, ?, ?)",
+            chunks
+        )
+    
+    def insert_images(self, images: Iterable[tuple]) -> int:
+        """Bulk insert (image_id, pdf_filename, page_number, image_path) rows"""
+        return self.execute_many(
+            "INSERT INTO images (image_id, pdf_filename, page_number, image_path) "
+            "VALUES (?, ?, ?, ?)",
+            images
+        )
@@ -3,82 +3,69 @@ Dependency Injection Module
 Manage application dependencies
 """
 
-from typing import Dict, Any, Callable, Optional, Type
+from typing import Dict, Any, Callable, Optional, Tuple, Type
 from logger import logger
 
 
+# Entry kinds stored alongside each registered value
+_SERVICE = 0
+_SINGLETON = 1
+_FACTORY = 2
+
+
 class Container:
     """Dependency injection container"""
     
+    __slots__ = ("_entries",)
+    
     def __init__(self):
-        self._services: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
-        self._singletons: Dict[str, Any] = {}
+        # name -> (kind, value); a factory entry holds the callable
+        self._entries: Dict[str, Tuple[int, Any]] = {}
     
     def register(self, name: str, service: Any):
         """Register a service"""
-        self._services[name] = service
-        logger.info(f"Service registered: {name}")
+        self._entries[name] = (_SERVICE, service)
+        logger.info("Service registered: %s", name)
     
     def register_factory(self, name: str, factory: Callable):
         """Register a factory function"""
-        self._factories[name] = factory
-        logger.info(f"Factory registered: {name}")
+        self._entries[name] = (_FACTORY, factory)
+        logger.info("Factory registered: %s", name)
     
     def register_singleton(self, name: str, factory: Callable):
         """Register a singleton"""
-        self._factories[name] = factory
         # Create instance immediately
-        self._singletons[name] = factory()
-        logger.info(f"Singleton registered: {name}")
+        self._entries[name] = (_SINGLETON, factory())
+        logger.info("Singleton registered: %s", name)
     
     def get(self, name: str) -> Optional[Any]:
         """Get service or dependency"""
-        # Check if it's a registered service
-        if name in self._services:
-            return self._services[name]
-        
-        # Check if it's a singleton
-        if name in self._singletons:
-            return self._singletons[name]
-        
-        # Check if it's a factory
-        if name in self._factories:
-            return self._factories[name]()
+        entry = self._entries.get(name)
+        if entry is None:
+            logger.warning("Service not found: %s", name)
+            return None
         
-        logger.warning(f"Service not found: {name}")
-        return None
+        kind, value = entry
+        if kind == _FACTORY:
+            return value()
+        return value
     
     def has(self, name: str) -> bool:
         """Check if service is registered"""
-        return name in self._services or name in self._factories or name in self._singletons
+        return name in self._entries
     
     def remove(self, name: str) -> bool:
         """Remove service"""
-        removed = False
-        
-        if name in self._services:
-            del self._services[name]
-            removed = True
-        
-        if name in self._factories:
-            del self._factories[name]
-            removed = True
-        
-        if name in self._singletons:
-            del self._singletons[name]
-            removed = True
-        
-        if removed:
-            logger.info(f"Service removed: {name}")
+        if name not in self._entries:
+            return False
         
-        return removed
+        del self._entries[name]
+        logger.info("Service removed: %s", name)
+        return True
     
     def clear(self):
         """Clear all services"""
-        self._services.clear()
-        self._factories.clear()
-        self._singletons.clear()
+        self._entries.clear()
         logger.info("Container cleared")
 
 
@@ -11,21 +11,56 @@ import os
 from logger import logger
 
 
+# SMTP settings, read once at import
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SENDER_EMAIL = os.getenv("SENDER_EMAIL", "")
+SENDER_PASSWORD = os.getenv("SENDER_PASSWORD", "")
+
+
 class EmailService:
     """Email service for sending notifications"""
     
     def __init__(
         self,
-        smtp_server: str = os.getenv("SMTP_SERVER", "smtp.gmail.com"),
-        smtp_port: int = int(os.getenv("SMTP_PORT", "587")),
-        sender_email: str = os.getenv("SENDER_EMAIL", ""),
-        sender_password: str = os.getenv("SENDER_PASSWORD", "")
+        smtp_server: str = SMTP_SERVER,
+        smtp_port: int = SMTP_PORT,
+        sender_email: str = SENDER_EMAIL,
+        sender_password: str = SENDER_PASSWORD
     ):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.sender_email = sender_email
         self.sender_password = sender_password
     
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        html: bool = False
+    ) -> MIMEMultipart:
+        """Build MIME message"""
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = self.sender_email
+        message["To"] = to_email
+        
+        mime_type = "html" if html else "plain"
+        message.attach(MIMEText(body, mime_type))
+        return message
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection"""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
     def send_email(
         self,
         to_email: str,
@@ -35,23 +70,15 @@ class EmailService:
     ) -> bool:
         """Send email"""
         try:
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = self.sender_email
-            message["To"] = to_email
-            
-            mime_type = "html" if html else "plain"
-            message.attach(MIMEText(body, mime_type))
+            message = self._build_message(to_email, subject, body, html)
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
+            with self._connect() as server:
                 server.sendmail(self.sender_email, to_email, message.as_string())
             
-            logger.info(f"Email sent to {to_email}")
+            logger.info("Email sent to %s", to_email)
             return True
         except Exception as e:
-            logger.error(f"Failed to send email: {str(e)}")
+            logger.error("Failed to send email: %s", e)
             return False
     
     def send_batch_emails(
@@ -61,11 +88,25 @@ class EmailService:
         body: str,
         html: bool = False
     ) -> int:
-        """Send emails to multiple recipients"""
+        """Send emails to multiple recipients over one SMTP connection"""
+        if not to_emails:
+            return 0
+        
         success_count = 0
-        for email in to_emails:
-            if self.send_email(email, subject, body, html):
-                success_count += 1
+        try:
+            with self._connect() as server:
+                for email in to_emails:
+                    try:
+                        message = self._build_message(email, subject, body, html)
+                        server.sendmail(self.sender_email, email, message.as_string())
+                        success_count += 1
+                        logger.info("Email sent to %s", email)
+                    except smtplib.SMTPServerDisconnected:
+                        raise
+                    except Exception as e:
+                        logger.error("Failed to send email to %s: %s", email, e)
+        except Exception as e:
+            logger.error("Batch email send aborted: %s", e)
         
         return success_count
     
@@ -3,22 +3,36 @@ Embedding Generation Module
 Generates vector embeddings for text chunks and image metadata
 """
 
+import asyncio
 import json
+import ijson
 import numpy as np
 from sentence_transformers import SentenceTransformer
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
+import threading
+from di_container import get_container
 
 
 class EmbeddingGenerator:
-    """Generate embeddings using sentence-transformers"""
+    """Generate L2-normalized embeddings using sentence-transformers"""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # Number of chunks parsed and encoded together when streaming chunks.json
+    STREAM_WINDOW = 256
+    
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        max_query_batch: int = 32,
+        max_query_wait_ms: float = 5.0
+    ):
         """
         Initialize the embedding model
         
         Args:
             model_name: Name of the sentence-transformer model to use
+            max_query_batch: Max concurrent queries encoded in one forward pass
+            max_query_wait_ms: How long to wait for more queries to batch
         """
         print(f"🤖 Loading embedding model: {model_name}")
         print("📥 (First time will download ~80MB, subsequent runs are instant)")
@@ -26,6 +40,12 @@ class EmbeddingGenerator:
         self.model = SentenceTransformer(model_name)
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
         
+        # Query coalescing state, created on first async use
+        self.max_query_batch = max_query_batch
+        self.max_query_wait = max_query_wait_ms / 1000
+        self._query_queue: Optional[asyncio.Queue] = None
+        self._query_worker: Optional[asyncio.Task] = None
+        
         print(f"✅ Model loaded! Embedding dimension: {self.embedding_dim}")
     
     def generate_text_embeddings(self, chunks_file: str) -> tuple:
@@ -36,35 +56,67 @@ class EmbeddingGenerator:
             chunks_file: Path to chunks.json file
             
         Returns:
-            Tuple of (embeddings_array, chunk_ids, chunks_data)
+            Tuple of (embeddings_array, chunk_ids, texts, chunk_indices)
         """
-        print(f"\n📄 Loading chunks from: {chunks_file}")
+        print(f"\n📄 Streaming chunks from: {chunks_file}")
+        print("   (This may take 10-30 seconds)")
         
-        # Load chunks
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            chunks = json.load(f)
+        chunk_ids = []
+        texts = []
+        chunk_indices = []
+        embeddings = np.empty((self.STREAM_WINDOW, self.embedding_dim), dtype=np.float32)
+        count = 0
         
-        print(f"✅ Loaded {len(chunks)} chunks")
+        # Parse chunks incrementally and keep only the columns the vector store
+        # needs; each parsed chunk dict is dropped once its fields are taken
+        with open(chunks_file, 'rb') as f:
+            for chunk in ijson.items(f, 'item'):
+                chunk_ids.append(chunk['id'])
+                texts.append(chunk['text'])
+                chunk_indices.append(chunk['chunk_index'])
+                
+                if len(texts) - count == self.STREAM_WINDOW:
+                    embeddings, count = self._append_embeddings(
+                        embeddings, count, texts[count:]
+                    )
         
-        # Extract texts and IDs
-        texts = [chunk['text'] for chunk in chunks]
-        chunk_ids = [chunk['id'] for chunk in chunks]
+        if len(texts) > count:
+            embeddings, count = self._append_embeddings(embeddings, count, texts[count:])
         
-        print(f"🔄 Generating embeddings for {len(texts)} chunks...")
-        print("   (This may take 10-30 seconds)")
+        # Trim the geometrically grown buffer so the slack isn't kept alive
+        if count < len(embeddings):
+            embeddings = embeddings[:count].copy()
         
-        # Generate embeddings in batch (much faster!)
-        embeddings = self.model.encode(
+        print(f"✅ Generated {len(embeddings)} embeddings")
+        print(f"   Shape: {embeddings.shape}")
+        
+        return embeddings, chunk_ids, texts, chunk_indices
+    
+    def _append_embeddings(self, embeddings: np.ndarray, count: int,
+                           texts: List[str]) -> tuple:
+        """
+        Encode texts into the preallocated embeddings buffer, growing it
+        geometrically when full
+        
+        Returns:
+            Tuple of (embeddings_buffer, new_count)
+        """
+        encoded = self.model.encode(
             texts,
-            show_progress_bar=True,
             batch_size=32,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
         
-        print(f"✅ Generated {len(embeddings)} embeddings")
-        print(f"   Shape: {embeddings.shape}")
+        needed = count + len(encoded)
+        if needed > len(embeddings):
+            grown = np.empty((max(needed, 2 * len(embeddings)), self.embedding_dim),
+                             dtype=embeddings.dtype)
+            grown[:count] = embeddings[:count]
+            embeddings = grown
         
-        return embeddings, chunk_ids, chunks
+        embeddings[count:needed] = encoded
+        return embeddings, needed
     
     def generate_image_embeddings(self, metadata_file: str) -> tuple:
         """
@@ -87,23 +139,16 @@ class EmbeddingGenerator:
         
         # Create rich text representations for each image
         # Combine title, description, and keywords for better matching
-        texts = []
-        image_ids = []
-        
-        for img in images:
-            # Create a comprehensive text representation
-            keywords_str = ", ".join(img['keywords'])
-            topics_str = ", ".join(img['topics'])
-            
-            rich_text = (
-                f"{img['title']}. "
-                f"{img['description']} "
-                f"Keywords: {keywords_str}. "
-                f"Topics: {topics_str}."
-            )
-            
-            texts.append(rich_text)
-            image_ids.append(img['id'])
+        texts = [
+            "".join((
+                img['title'], ". ",
+                img['description'], " Keywords: ",
+                ", ".join(img['keywords']), ". Topics: ",
+                ", ".join(img['topics']), "."
+            ))
+            for img in images
+        ]
+        image_ids = [img['id'] for img in images]
         
         print(f"🔄 Generating embeddings for {len(texts)} images...")
         
@@ -112,7 +157,8 @@ class EmbeddingGenerator:
             texts,
             show_progress_bar=True,
             batch_size=32,
-            convert_to_numpy=True
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
         
         print(f"✅ Generated {len(embeddings)} image embeddings")
@@ -130,8 +176,133 @@ class EmbeddingGenerator:
         Returns:
             Embedding vector as numpy array
         """
-        embedding = self.model.encode(query, convert_to_numpy=True)
+        embedding = self.model.encode(
+            query,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
         return embedding
+    
+    async def generate_query_embedding_async(self, query: str) -> np.ndarray:
+        """
+        Generate embedding for a query, sharing a forward pass with
+        other queries that arrive within max_query_wait_ms
+        
+        Args:
+            query: User's question or search query
+            
+        Returns:
+            Embedding vector as numpy array
+        """
+        if self._query_worker is None or self._query_worker.done():
+            self._query_queue = asyncio.Queue()
+            self._query_worker = asyncio.create_task(self._encode_query_batches())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._query_queue.put((query, future))
+        return await future
+    
+    async def _encode_query_batches(self):
+        """Background task encoding queued queries in micro-batches"""
+        loop = asyncio.get_running_loop()
+        queue = self._query_queue
+        
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_query_wait
+            
+            while len(batch) < self.max_query_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            queries = [query for query, _ in batch]
+            try:
+                # Encode off the event loop; the model call is CPU/GPU bound
+                embeddings = await loop.run_in_executor(
+                    None,
+                    lambda: self.model.encode(
+                        queries,
+                        batch_size=len(queries),
+                        convert_to_numpy=True,
+                        normalize_embeddings=True
+                    )
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize a vector or the rows of a matrix as contiguous float32,
+    in place when the input already is contiguous float32
+    
+    Args:
+        vectors: Array of shape (dim,) or (n, dim)
+        
+    Returns:
+        Normalized array (zero vectors are left as zeros)
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def score_all(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of a normalized query against every row of a
+    normalized embedding matrix, as a single BLAS matrix-vector product
+    
+    Args:
+        query: Query vector of shape (dim,)
+        matrix: Embedding matrix of shape (n, dim)
+        
+    Returns:
+        Similarity scores of shape (n,)
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    return matrix @ query.astype(np.float32, copy=False)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+_generator_lock = threading.Lock()
+
+
+def _create_warm_generator() -> EmbeddingGenerator:
+    """Load the model and run one encode so the first query skips warm-up"""
+    generator = EmbeddingGenerator()
+    generator.generate_query_embedding("warm up")
+    return generator
+
+
+def get_embedding_generator() -> EmbeddingGenerator:
+    """Get the shared embedding generator (a DI container singleton)"""
+    container = get_container()
+    if not container.has("embedding_generator"):
+        with _generator_lock:
+            if not container.has("embedding_generator"):
+                container.register_singleton("embedding_generator", _create_warm_generator)
+    return container.get("embedding_generator")
 
 
 def main():
@@ -144,7 +315,7 @@ def main():
     generator = EmbeddingGenerator()
     
     # Generate text embeddings
-    text_embeddings, chunk_ids, chunks = generator.generate_text_embeddings(
+    text_embeddings, chunk_ids, texts, chunk_indices = generator.generate_text_embeddings(
         "data/chunks.json"
     )
     
@@ -165,15 +336,11 @@ def main():
     print(f"✅ Query embedding shape: {query_embedding.shape}")
     print(f"   First 5 values: {query_embedding[:5]}")
     
-    # Calculate similarity with first chunk (manual test)
-    from numpy.linalg import norm
-    
-    def cosine_similarity(a, b):
-        return np.dot(a, b) / (norm(a) * norm(b))
-    
-    similarity = cosine_similarity(query_embedding, text_embeddings[0])
-    print(f"\n📊 Similarity with first chunk: {similarity:.4f}")
-    print(f"   Chunk text preview: {chunks[0]['text'][:100]}...")
+    # Embeddings are L2-normalized, so cosine similarity is a plain dot product
+    scores = score_all(query_embedding, text_embeddings)
+    best = int(top_k_indices(scores, 1)[0])
+    print(f"\n📊 Best matching chunk similarity: {scores[best]:.4f}")
+    print(f"   Chunk text preview: {texts[best][:100]}...")
     
     print("\n" + "=" * 70)
     print("✅ EMBEDDING GENERATION COMPLETE!")
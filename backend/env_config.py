@@ -3,6 +3,7 @@ Environment Configuration Validator
 Validates that all required environment variables are set
 """
 
+import functools
 import os
 from typing import Dict, List, Tuple
 from logger import logger
@@ -38,8 +39,9 @@ def validate_environment() -> Tuple[bool, List[str]]:
     return len(missing) == 0, missing
 
 
+@functools.lru_cache(maxsize=1)
 def get_environment_status() -> Dict[str, any]:
-    """Get environment configuration status"""
+    """Get environment configuration status (cached until load_environment)"""
     status = {
         "required_vars": {},
         "optional_vars": {},
@@ -69,6 +71,7 @@ def get_environment_status() -> Dict[str, any]:
 
 def load_environment():
     """Load and validate environment configuration"""
+    get_environment_status.cache_clear()
     is_valid, missing = validate_environment()
     
     if not is_valid:
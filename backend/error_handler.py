@@ -4,19 +4,25 @@ Centralized error handling and recovery
 """
 
 from typing import Callable, Any
+import asyncio
 import functools
+import random
+import time
 from logger import logger
 
 
 def handle_exceptions(func: Callable) -> Callable:
     """Decorator to handle exceptions gracefully"""
-    @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}")
-            raise
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {str(e)}")
+                raise
+        
+        return async_wrapper
     
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
@@ -26,32 +32,36 @@ def handle_exceptions(func: Callable) -> Callable:
             logger.error(f"Error in {func.__name__}: {str(e)}")
             raise
     
-    # Return appropriate wrapper
-    import asyncio
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
 
 
+def _backoff_delay(delay: float, attempt: int) -> float:
+    """Exponential backoff for an attempt with up to 10% jitter"""
+    wait = delay * (2 ** attempt)
+    return wait + random.uniform(0, wait * 0.1)
+
+
 def retry_on_failure(max_attempts: int = 3, delay: float = 1.0):
-    """Decorator to retry function on failure"""
+    """Decorator to retry function on failure with exponential backoff"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            import asyncio
-            for attempt in range(max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    if attempt == max_attempts - 1:
-                        logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
-                        raise
-                    logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay}s")
-                    await asyncio.sleep(delay)
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        if attempt == max_attempts - 1:
+                            logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
+                            raise
+                        wait = _backoff_delay(delay, attempt)
+                        logger.warning(f"Attempt {attempt + 1} failed, retrying in {wait:.2f}s")
+                        await asyncio.sleep(wait)
+            
+            return async_wrapper
         
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            import time
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
@@ -59,11 +69,9 @@ def retry_on_failure(max_attempts: int = 3, delay: float = 1.0):
                     if attempt == max_attempts - 1:
                         logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
                         raise
-                    logger.warning(f"Attempt {attempt + 1} failed, retrying in {delay}s")
-                    time.sleep(delay)
+                    wait = _backoff_delay(delay, attempt)
+                    logger.warning(f"Attempt {attempt + 1} failed, retrying in {wait:.2f}s")
+                    time.sleep(wait)
         
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
     return decorator
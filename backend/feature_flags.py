@@ -3,7 +3,8 @@ Feature Flag Manager
 Feature flagging for gradual rollouts
 """
 
-from typing import Dict, List, Any
+import xxhash
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from logger import logger
 
@@ -23,7 +24,13 @@ class FeatureFlag:
         self.percentage = min(100, max(0, percentage))
         self.description = description
         self.created_at = datetime.now()
+        self.created_at_iso = self.created_at.isoformat()
+        self.touch()
+    
+    def touch(self):
+        """Record an update, caching its ISO timestamp for to_dict"""
         self.updated_at = datetime.now()
+        self.updated_at_iso = self.updated_at.isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -32,8 +39,8 @@ class FeatureFlag:
             "enabled": self.enabled,
             "percentage": self.percentage,
             "description": self.description,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at_iso,
+            "updated_at": self.updated_at_iso
         }
 
 
@@ -42,6 +49,11 @@ class FeatureFlagManager:
     
     def __init__(self):
         self.flags: Dict[str, FeatureFlag] = {}
+        # (enabled, percentage) per flag for is_enabled; kept in sync by the
+        # create/update/delete methods, so change flags through them
+        self._flag_state: Dict[str, Tuple[bool, int]] = {}
+        # Serialized flags for get_all_flags, dropped on any write
+        self._dict_cache: Optional[Dict[str, Dict[str, Any]]] = None
     
     def create_flag(
         self,
@@ -53,7 +65,9 @@ class FeatureFlagManager:
         """Create feature flag"""
         flag = FeatureFlag(name, enabled, percentage, description)
         self.flags[name] = flag
-        logger.info(f"Feature flag created: {name}")
+        self._flag_state[name] = (flag.enabled, flag.percentage)
+        self._dict_cache = None
+        logger.info("Feature flag created: %s", name)
         return flag
     
     def update_flag(
@@ -72,33 +86,34 @@ class FeatureFlagManager:
         if percentage is not None:
             flag.percentage = min(100, max(0, percentage))
         
-        flag.updated_at = datetime.now()
-        logger.info(f"Feature flag updated: {name}")
+        flag.touch()
+        self._flag_state[name] = (flag.enabled, flag.percentage)
+        self._dict_cache = None
+        logger.info("Feature flag updated: %s", name)
         return True
     
     def is_enabled(self, name: str, user_id: str = None) -> bool:
         """Check if feature flag is enabled"""
-        if name not in self.flags:
+        state = self._flag_state.get(name)
+        if state is None:
             return False
         
-        flag = self.flags[name]
+        enabled, percentage = state
         
-        if not flag.enabled:
+        if not enabled:
             return False
         
-        if flag.percentage == 100:
+        if percentage == 100:
             return True
         
-        if flag.percentage == 0:
+        if percentage == 0:
             return False
         
-        # Hash user_id to determine if user is in the percentage
+        # Hash user_id to determine if user is in the percentage; xxh3 uses a
+        # fixed seed so buckets are stable across processes
         if user_id:
-            hash_value = int(
-                hashlib.md5(f"{name}{user_id}".encode()).hexdigest(),
-                16
-            )
-            return (hash_value % 100) < flag.percentage
+            hash_value = xxhash.xxh3_64_intdigest(f"{name}\0{user_id}".encode())
+            return (hash_value % 100) < percentage
         
         return True
     
@@ -108,13 +123,17 @@ class FeatureFlagManager:
     
     def get_all_flags(self) -> Dict[str, Dict[str, Any]]:
         """Get all feature flags"""
-        return {name: flag.to_dict() for name, flag in self.flags.items()}
+        if self._dict_cache is None:
+            self._dict_cache = {name: flag.to_dict() for name, flag in self.flags.items()}
+        return self._dict_cache
     
     def delete_flag(self, name: str) -> bool:
         """Delete feature flag"""
         if name in self.flags:
             del self.flags[name]
-            logger.info(f"Feature flag deleted: {name}")
+            del self._flag_state[name]
+            self._dict_cache = None
+            logger.info("Feature flag deleted: %s", name)
             return True
         return False
 
@@ -5,6 +5,7 @@ Manages file storage and retrieval
 
 import os
 import shutil
+import aiofiles
 from typing import List, Optional
 from pathlib import Path
 from logger import logger
@@ -23,10 +24,10 @@ class FileStorage:
             file_path = self.base_path / filename
             with open(file_path, 'wb') as f:
                 f.write(content)
-            logger.info(f"File saved: {filename}")
+            logger.info("File saved: %s", filename)
             return True
         except Exception as e:
-            logger.error(f"Failed to save file {filename}: {str(e)}")
+            logger.error("Failed to save file %s: %s", filename, e)
             return False
     
     def get_file(self, filename: str) -> Optional[bytes]:
@@ -39,7 +40,32 @@ class FileStorage:
             with open(file_path, 'rb') as f:
                 return f.read()
         except Exception as e:
-            logger.error(f"Failed to read file {filename}: {str(e)}")
+            logger.error("Failed to read file %s: %s", filename, e)
+            return None
+    
+    async def save_file_async(self, filename: str, content: bytes) -> bool:
+        """Save file to storage without blocking the event loop"""
+        try:
+            file_path = self.base_path / filename
+            async with aiofiles.open(file_path, 'wb') as f:
+                await f.write(content)
+            logger.info("File saved: %s", filename)
+            return True
+        except Exception as e:
+            logger.error("Failed to save file %s: %s", filename, e)
+            return False
+    
+    async def get_file_async(self, filename: str) -> Optional[bytes]:
+        """Retrieve file from storage without blocking the event loop"""
+        try:
+            file_path = self.base_path / filename
+            if not file_path.exists():
+                return None
+            
+            async with aiofiles.open(file_path, 'rb') as f:
+                return await f.read()
+        except Exception as e:
+            logger.error("Failed to read file %s: %s", filename, e)
             return None
     
     def delete_file(self, filename: str) -> bool:
@@ -48,10 +74,10 @@ class FileStorage:
             file_path = self.base_path / filename
             if file_path.exists():
                 file_path.unlink()
-                logger.info(f"File deleted: {filename}")
+                logger.info("File deleted: %s", filename)
             return True
         except Exception as e:
-            logger.error(f"Failed to delete file {filename}: {str(e)}")
+            logger.error("Failed to delete file %s: %s", filename, e)
             return False
     
     def list_files(self) -> List[str]:
@@ -59,7 +85,7 @@ class FileStorage:
         try:
             return [f.name for f in self.base_path.glob("*") if f.is_file()]
         except Exception as e:
-            logger.error(f"Failed to list files: {str(e)}")
+            logger.error("Failed to list files: %s", e)
             return []
     
     def get_file_size(self, filename: str) -> int:
@@ -68,7 +94,7 @@ class FileStorage:
             file_path = self.base_path / filename
             return file_path.stat().st_size if file_path.exists() else 0
         except Exception as e:
-            logger.error(f"Failed to get file size: {str(e)}")
+            logger.error("Failed to get file size: %s", e)
             return 0
     
     def clear_old_files(self, days: int = 30) -> int:
@@ -83,6 +109,6 @@ class FileStorage:
                     file_path.unlink()
                     deleted += 1
         except Exception as e:
-            logger.error(f"Failed to clear old files: {str(e)}")
+            logger.error("Failed to clear old files: %s", e)
         
         return deleted
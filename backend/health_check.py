@@ -3,28 +3,65 @@ Health Check Service
 Extended health monitoring with detailed endpoints
 """
 
-from typing import Dict, Any
+from collections import deque
+from typing import Dict, Any, Callable
+import asyncio
+import threading
+import time
 import psutil
 from datetime import datetime
 from logger import logger
 
+_STATUS = ("healthy", "warning", "unhealthy")
+_MB = 1024 * 1024
+
+
+def _status_level(percent: float) -> int:
+    """Map a usage percentage to an index into _STATUS"""
+    return (percent >= 80) + (percent >= 95)
+
 
 class HealthCheckService:
     """Comprehensive health check service with enhanced monitoring"""
     
     def __init__(self):
         self.start_time = datetime.now()
+        self._start_time_iso = self.start_time.isoformat()
+        self._start_ns = time.monotonic_ns()
         self.last_check = None
-        self.check_history = []
+        self._last_check_at = 0.0
+        self.ready_ttl = 10.0
+        self._liveness = None
+        self._liveness_second = None
         self.max_history = 100
+        self.check_history = deque(maxlen=self.max_history)
+        self.cpu_ttl = 5.0
+        self.resource_ttl = 2.0
+        self._probe_cache: Dict[str, tuple] = {}
+        self._probe_lock = threading.Lock()
+        # Prime the counter so later non-blocking calls return a real delta
+        psutil.cpu_percent(interval=None)
+    
+    def _cached_probe(self, name: str, ttl: float, probe: Callable[[], Any]) -> Any:
+        """Return a recent probe result, refreshing it once the TTL expires"""
+        with self._probe_lock:
+            now = time.monotonic()
+            cached = self._probe_cache.get(name)
+            if cached is not None and now - cached[0] < ttl:
+                return cached[1]
+            value = probe()
+            self._probe_cache[name] = (now, value)
+            return value
     
     def check_cpu_health(self) -> Dict[str, Any]:
         """Check CPU health"""
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = self._cached_probe(
+            "cpu", self.cpu_ttl, lambda: psutil.cpu_percent(interval=None)
+        )
         cpu_count = psutil.cpu_count()
         
         return {
-            "status": "healthy" if cpu_percent < 80 else "warning" if cpu_percent < 95 else "unhealthy",
+            "status": _STATUS[_status_level(cpu_percent)],
             "usage_percent": cpu_percent,
             "core_count": cpu_count,
             "threshold": 80
@@ -32,27 +69,29 @@ class HealthCheckService:
     
     def check_memory_health(self) -> Dict[str, Any]:
         """Check memory health"""
-        memory = psutil.virtual_memory()
+        memory = self._cached_probe("memory", self.resource_ttl, psutil.virtual_memory)
         
         return {
-            "status": "healthy" if memory.percent < 80 else "warning" if memory.percent < 95 else "unhealthy",
+            "status": _STATUS[_status_level(memory.percent)],
             "usage_percent": memory.percent,
-            "used_mb": memory.used // (1024 * 1024),
-            "total_mb": memory.total // (1024 * 1024),
-            "available_mb": memory.available // (1024 * 1024),
+            "used_mb": memory.used // _MB,
+            "total_mb": memory.total // _MB,
+            "available_mb": memory.available // _MB,
             "threshold": 80
         }
     
     def check_disk_health(self) -> Dict[str, Any]:
         """Check disk health"""
-        disk = psutil.disk_usage('/')
+        disk = self._cached_probe(
+            "disk", self.resource_ttl, lambda: psutil.disk_usage('/')
+        )
         
         return {
-            "status": "healthy" if disk.percent < 80 else "warning" if disk.percent < 95 else "unhealthy",
+            "status": _STATUS[_status_level(disk.percent)],
             "usage_percent": disk.percent,
-            "used_mb": disk.used // (1024 * 1024),
-            "total_mb": disk.total // (1024 * 1024),
-            "free_mb": disk.free // (1024 * 1024),
+            "used_mb": disk.used // _MB,
+            "total_mb": disk.total // _MB,
+            "free_mb": disk.free // _MB,
             "threshold": 80
         }
     
@@ -63,80 +102,98 @@ class HealthCheckService:
         return {
             "status": "healthy",
             "pid": process.pid,
-            "memory_mb": process.memory_info().rss // (1024 * 1024),
+            "memory_mb": process.memory_info().rss // _MB,
             "cpu_percent": process.cpu_percent(),
             "threads": process.num_threads()
         }
     
+    def _uptime_seconds(self) -> float:
+        """Seconds since the service started, from the monotonic clock"""
+        return (time.monotonic_ns() - self._start_ns) * 1e-9
+    
     def get_uptime(self) -> Dict[str, Any]:
         """Get application uptime"""
-        uptime = datetime.now() - self.start_time
+        seconds = self._uptime_seconds()
         
         return {
-            "uptime_seconds": uptime.total_seconds(),
-            "uptime_minutes": uptime.total_seconds() / 60,
-            "uptime_hours": uptime.total_seconds() / 3600,
-            "start_time": self.start_time.isoformat()
+            "uptime_seconds": seconds,
+            "uptime_minutes": seconds / 60,
+            "uptime_hours": seconds / 3600,
+            "start_time": self._start_time_iso
         }
     
-    def perform_health_check(self) -> Dict[str, Any]:
-        """Perform comprehensive health check"""
+    async def perform_health_check(self) -> Dict[str, Any]:
+        """Perform comprehensive health check without blocking the event loop"""
+        return await asyncio.to_thread(self._sync_collect)
+    
+    def _sync_collect(self) -> Dict[str, Any]:
+        """Collect all health probes synchronously"""
+        cpu = self.check_cpu_health()
+        memory = self.check_memory_health()
+        disk = self.check_disk_health()
+        
+        # Overall status is the worst of the resource checks
+        level = max(
+            _STATUS.index(cpu["status"]),
+            _STATUS.index(memory["status"]),
+            _STATUS.index(disk["status"])
+        )
+        
         health_status = {
             "timestamp": datetime.now().isoformat(),
-            "overall_status": "healthy",
+            "overall_status": _STATUS[level],
             "checks": {
-                "cpu": self.check_cpu_health(),
-                "memory": self.check_memory_health(),
-                "disk": self.check_disk_health(),
+                "cpu": cpu,
+                "memory": memory,
+                "disk": disk,
                 "process": self.check_process_health()
             },
             "uptime": self.get_uptime()
         }
         
-        # Determine overall status
-        statuses = [
-            health_status["checks"]["cpu"]["status"],
-            health_status["checks"]["memory"]["status"],
-            health_status["checks"]["disk"]["status"]
-        ]
-        
-        if "unhealthy" in statuses:
-            health_status["overall_status"] = "unhealthy"
-        elif "warning" in statuses:
-            health_status["overall_status"] = "warning"
-        
         self.last_check = health_status
+        self._last_check_at = time.monotonic()
         self.check_history.append(health_status)
         
-        # Keep last max_history checks
-        if len(self.check_history) > self.max_history:
-            self.check_history.pop(0)
-        
         return health_status
     
-    def get_detailed_status(self) -> Dict[str, Any]:
+    async def get_detailed_status(self) -> Dict[str, Any]:
         """Get detailed health status with history"""
         return {
-            "current": self.last_check or self.perform_health_check(),
+            "current": self.last_check or await self.perform_health_check(),
             "history_count": len(self.check_history),
-            "start_time": self.start_time.isoformat(),
-            "uptime_seconds": (datetime.now() - self.start_time).total_seconds()
+            "start_time": self._start_time_iso,
+            "uptime_seconds": self._uptime_seconds()
         }
     
-    def get_readiness(self) -> Dict[str, bool]:
+    def _quick_probe(self) -> str:
+        """Cheap status estimate from memory usage alone"""
+        memory = self._cached_probe("memory", self.resource_ttl, psutil.virtual_memory)
+        return _STATUS[_status_level(memory.percent)]
+    
+    async def get_readiness(self) -> Dict[str, bool]:
         """Check if service is ready to accept traffic"""
-        health = self.perform_health_check()
+        # Reuse a recent full check; otherwise fall back to the quick probe
+        if self.last_check is not None and time.monotonic() - self._last_check_at < self.ready_ttl:
+            status = self.last_check["overall_status"]
+        else:
+            status = self._quick_probe()
         return {
-            "ready": health["overall_status"] != "unhealthy",
-            "status": health["overall_status"]
+            "ready": status != "unhealthy",
+            "status": status
         }
     
     def get_liveness(self) -> Dict[str, bool]:
         """Check if service is alive"""
-        return {
-            "alive": True,
-            "timestamp": datetime.now().isoformat()
-        }
+        # The payload only changes once per second, so rebuild it lazily
+        second = int(time.time())
+        if second != self._liveness_second:
+            self._liveness = {
+                "alive": True,
+                "timestamp": datetime.fromtimestamp(second).isoformat()
+            }
+            self._liveness_second = second
+        return self._liveness
 
 
 # Global health check service
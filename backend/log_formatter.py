@@ -3,13 +3,73 @@ Logging Formatter
 Enhanced logging with formatting and rotation
 """
 
+import atexit
 import logging
 import logging.handlers
+import threading
+import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 
+try:
+    # Safe rotation when several uvicorn workers share one log file
+    from concurrent_log_handler import ConcurrentRotatingFileHandler as RotatingFileHandler
+except ImportError:
+    RotatingFileHandler = logging.handlers.RotatingFileHandler
 
-class ColoredFormatter(logging.Formatter):
+# None of our format strings use thread or process fields, so skip
+# collecting them on every LogRecord
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Background listeners that drain each logger's queue, keyed by logger name
+_listeners = {}
+
+
+class _LogRecordQueue:
+    """Unbounded FIFO with the put_nowait/get interface QueueHandler and QueueListener use"""
+    
+    def __init__(self):
+        self._items = deque()
+        self._not_empty = threading.Condition(threading.Lock())
+    
+    def put_nowait(self, item):
+        with self._not_empty:
+            self._items.append(item)
+            self._not_empty.notify()
+    
+    def get(self, block: bool = True):
+        # The listener always blocks, so there is no timeout/Empty handling
+        with self._not_empty:
+            while not self._items:
+                self._not_empty.wait()
+            return self._items.popleft()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp within the same second"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, None)
+    
+    def formatTime(self, record, datefmt=None):
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_value = self._cached_time
+        if second == cached_second:
+            return cached_value
+        value = time.strftime(datefmt, self.converter(second))
+        self._cached_time = (second, value)
+        return value
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Colored log formatter for console output"""
     
     COLORS = {
@@ -20,11 +80,25 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '\033[35m'  # Magenta
     }
     RESET = '\033[0m'
+    COLORED_LEVELS = {}
     
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Color only for this formatter; other handlers see the plain name
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELS.get(
+            levelname, f"{self.RESET}{levelname}{self.RESET}"
+        )
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+# Precompute colored level names once instead of per record
+ColoredFormatter.COLORED_LEVELS = {
+    level: f"{color}{level}{ColoredFormatter.RESET}"
+    for level, color in ColoredFormatter.COLORS.items()
+}
 
 
 def setup_rotating_file_handler(
@@ -37,15 +111,18 @@ def setup_rotating_file_handler(
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     
     filename = f"{log_dir}/{logger_name}_{datetime.now().strftime('%Y%m%d')}.log"
-    handler = logging.handlers.RotatingFileHandler(
+    handler = RotatingFileHandler(
         filename,
         maxBytes=max_bytes,
-        backupCount=backup_count
+        backupCount=backup_count,
+        delay=True
     )
+    handler.terminator = "\n"
     
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        validate=False
     )
     handler.setFormatter(formatter)
     
@@ -68,9 +145,10 @@ def setup_timed_rotating_handler(
         interval=interval
     )
     
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        validate=False
     )
     handler.setFormatter(formatter)
     
@@ -89,6 +167,7 @@ def get_logger(
     
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -97,20 +176,46 @@ def get_logger(
     if use_color:
         formatter = ColoredFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            validate=False
         )
     else:
-        formatter = logging.Formatter(
+        formatter = CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            validate=False
         )
     
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler
     if enable_file_logging:
-        file_handler = setup_rotating_file_handler(name)
-        logger.addHandler(file_handler)
+        handlers.append(setup_rotating_file_handler(name))
+    
+    # Callers only enqueue records; a background thread does the I/O
+    log_queue = _LogRecordQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    _listeners[name] = listener
     
     return logger
+
+
+def _stop_listener(name: str):
+    """Stop a logger's background listener, flushing pending records"""
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_all_listeners():
+    """Flush every background listener on interpreter exit"""
+    for name in list(_listeners):
+        _stop_listener(name)
@@ -8,6 +8,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from log_formatter import CachedTimeFormatter
+
 
 def setup_logger(name: str = "ai_tutor", level: int = logging.INFO) -> logging.Logger:
     """
@@ -32,9 +34,10 @@ def setup_logger(name: str = "ai_tutor", level: int = logging.INFO) -> logging.L
     console_handler.setLevel(level)
     
     # Format with structured data
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(funcName)s() - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+        datefmt='%Y-%m-%d %H:%M:%S',
+        validate=False
     )
     console_handler.setFormatter(formatter)
     
@@ -5,15 +5,21 @@ AI Tutor RAG System Backend
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
 import os
-import shutil
+import threading
+import orjson
 
 from config import config
+from logger import logger
 from rag_service import get_rag_service
+from health_check import get_health_service
 from pdf_processor import PDFProcessor
+from embedding_generator import get_embedding_generator
+from vector_store import VectorStore
 
 # Initialize FastAPI app with API versioning
 app = FastAPI(
@@ -22,22 +28,49 @@ app = FastAPI(
     version="1.0.0",
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
-    redoc_url="/api/v1/redoc"
+    redoc_url="/api/v1/redoc",
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+# Configure CORS from the configured origin list; browsers reject
+# credentials with a wildcard origin, so only allow them for explicit origins
+_allowed_origins = sorted(set(config.ALLOWED_ORIGINS))
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
-    allow_credentials=True,
+    allow_origins=_allowed_origins,
+    allow_credentials="*" not in _allowed_origins,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["*"]
+    expose_headers=["*"],
+    max_age=86400  # Let browsers cache preflight responses for a day
 )
 
 # Ensure upload directory exists
 os.makedirs(config.UPLOAD_DIR, exist_ok=True)
 
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Batch size used when embedding uploaded chunks
+UPLOAD_ENCODE_BATCH_SIZE = 64
+
+# Upload pipeline services, created once and shared across requests
+_pdf_processor = None
+_vector_store = None
+_vector_store_lock = threading.Lock()
+
+# Parsed image metadata, keyed by the file's modification time
+_image_cache = {"mtime": None, "images": []}
+
+
+def get_upload_services():
+    """Get the shared PDF processor, embedding generator and vector store"""
+    global _pdf_processor, _vector_store
+    if _pdf_processor is None:
+        _pdf_processor = PDFProcessor()
+    if _vector_store is None:
+        _vector_store = VectorStore(embedding_dim=384)
+    return _pdf_processor, get_embedding_generator(), _vector_store
+
 
 # ============================================================================
 # PYDANTIC MODELS
@@ -104,59 +137,66 @@ async def upload_pdf(file: UploadFile = File(...)):
         if not file.filename.endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are allowed")
         
-        # Validate file size (read content to check size)
-        content = await file.read()
-        file_size_mb = len(content) / (1024 * 1024)
+        logger.info("Processing uploaded file: %s", file.filename)
         
-        if file_size_mb > config.MAX_FILE_SIZE_MB:
+        # Stream the upload to disk, enforcing the size limit as we go
+        file_path = os.path.join(config.UPLOAD_DIR, file.filename)
+        max_bytes = config.MAX_FILE_SIZE_MB * 1024 * 1024
+        total = 0
+        
+        buffer = await asyncio.to_thread(open, file_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_bytes:
+                    break
+                await asyncio.to_thread(buffer.write, chunk)
+        finally:
+            await asyncio.to_thread(buffer.close)
+        
+        if total > max_bytes:
+            os.remove(file_path)
             raise HTTPException(
                 status_code=400, 
                 detail=f"File too large. Maximum size: {config.MAX_FILE_SIZE_MB}MB"
             )
         
-        # Reset file pointer
-        await file.seek(0)
-        
-        print(f"\n📄 Processing uploaded file: {file.filename}")
-        
-        # Save uploaded file
-        file_path = os.path.join(config.UPLOAD_DIR, file.filename)
-        
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        logger.info("File saved to: %s", file_path)
         
-        print(f"✅ File saved to: {file_path}")
+        processor, generator, vector_store = get_upload_services()
         
         # Process PDF - Extract and chunk
-        from pdf_processor import PDFProcessor
-        from embedding_generator import EmbeddingGenerator
-        from vector_store import VectorStore
-        
-        processor = PDFProcessor()
-        chunks = processor.process_pdf(file_path, output_path=None)
+        # Extraction is CPU-bound; keep it off the event loop
+        chunks = await asyncio.to_thread(processor.process_pdf, file_path, output_path=None)
         
-        print(f"✅ Created {len(chunks)} chunks")
+        logger.info("Created %d chunks", len(chunks))
         
         # Generate embeddings for new chunks
-        print("🔄 Generating embeddings...")
-        generator = EmbeddingGenerator()
+        logger.info("Generating embeddings...")
         
         texts = [chunk['text'] for chunk in chunks]
         chunk_ids = [chunk['id'] for chunk in chunks]
-        embeddings = generator.model.encode(texts, convert_to_numpy=True)
+        embeddings = await asyncio.to_thread(
+            generator.model.encode,
+            texts,
+            batch_size=UPLOAD_ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
         
-        print(f"✅ Generated {len(embeddings)} embeddings")
+        logger.info("Generated %d embeddings", len(embeddings))
         
         # Update vector store (add to existing or create new)
-        print("💾 Updating vector store...")
-        vector_store = VectorStore(embedding_dim=384)
-        vector_store.create_text_index(embeddings, chunk_ids, chunks)
+        logger.info("Updating vector store...")
+        with _vector_store_lock:
+            vector_store.create_text_index(embeddings, chunk_ids, chunks)
         
         # Save to a unique location or update existing
         # For now, we'll keep using the same embeddings (this is a demo)
         # In production, you'd manage multiple topics/files
         
-        print(f"✅ Vector store updated")
+        logger.info("Vector store updated")
         
         # Generate topic ID
         topic_id = file.filename.replace('.pdf', '').lower().replace(' ', '_')
@@ -169,10 +209,10 @@ async def upload_pdf(file: UploadFile = File(...)):
             "filename": file.filename
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        import traceback
-        print(f"❌ Error processing upload: {e}")
-        print(traceback.format_exc())
+        logger.exception("Error processing upload")
         raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
 
 
@@ -202,8 +242,47 @@ async def chat(request: ChatRequest):
         return ChatResponse(**result)
         
     except Exception as e:
-        print(f"❌ Error in chat endpoint: {e}")
+        logger.exception("Error in chat endpoint")
+        raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint - answer text is sent as the LLM generates it
+    
+    - Retrieves relevant context chunks using RAG
+    - Streams the generated answer as plain text
+    """
+    if not config.validate():
+        raise HTTPException(
+            status_code=500,
+            detail="OpenRouter API key not configured. Please set OPENROUTER_API_KEY in .env file"
+        )
+    
+    try:
+        rag_service = get_rag_service()
+        text_chunks, _ = await asyncio.to_thread(rag_service.retrieve_context, request.question)
+    except Exception as e:
+        logger.exception("Error in chat stream endpoint")
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
+    
+    # Sync generators are iterated in a worker thread by Starlette
+    return StreamingResponse(
+        rag_service.generate_answer_stream(request.question, text_chunks),
+        media_type="text/plain; charset=utf-8"
+    )
+
+
+def _load_image_metadata() -> list:
+    """Load image metadata, re-parsing the file only when it changes"""
+    mtime = os.stat(config.IMAGE_METADATA_FILE).st_mtime_ns
+    if _image_cache["mtime"] != mtime:
+        with open(config.IMAGE_METADATA_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
+        _image_cache["images"] = data.get('images', [])
+        _image_cache["mtime"] = mtime
+    return _image_cache["images"]
 
 
 @app.get("/images/{topic_id}")
@@ -215,13 +294,7 @@ async def get_images(topic_id: str):
     - Useful for frontend to display image gallery
     """
     try:
-        import json
-        
-        # Load image metadata
-        with open(config.IMAGE_METADATA_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        images = data.get('images', [])
+        images = _load_image_metadata()
         
         return {
             "topic_id": topic_id,
@@ -230,7 +303,7 @@ async def get_images(topic_id: str):
         }
         
     except Exception as e:
-        print(f"❌ Error loading images: {e}")
+        logger.exception("Error loading images")
         raise HTTPException(status_code=500, detail=f"Error loading images: {str(e)}")
 
 
@@ -241,12 +314,17 @@ async def health_check():
         # Check if vector store is loaded
         rag_service = get_rag_service()
         
+        # System probes run in a worker thread so the event loop stays free
+        system = await get_health_service().perform_health_check()
+        
         return {
             "status": "healthy",
             "api_key_configured": bool(config.OPENROUTER_API_KEY),
             "model": config.MODEL_NAME,
             "vector_store": "loaded",
-            "embeddings": "ready"
+            "embeddings": "ready",
+            "system": system["overall_status"],
+            "checks": system["checks"]
         }
     except Exception as e:
         return {
@@ -255,6 +333,24 @@ async def health_check():
         }
 
 
+@app.get("/deep_health")
+async def deep_health_check():
+    """Full system health check (CPU, memory, disk and process probes)"""
+    return await get_health_service().perform_health_check()
+
+
+@app.get("/readiness")
+async def readiness_check():
+    """Lightweight readiness probe"""
+    return await get_health_service().get_readiness()
+
+
+@app.get("/liveness")
+async def liveness_check():
+    """Liveness probe"""
+    return get_health_service().get_liveness()
+
+
 # ============================================================================
 # STARTUP
 # ============================================================================
@@ -262,26 +358,29 @@ async def health_check():
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup"""
-    print("=" * 80)
-    print("🚀 Starting AI Tutor RAG System")
-    print("=" * 80)
+    logger.info("Starting AI Tutor RAG System")
     
     # Validate configuration
     if config.validate():
-        print("✅ Configuration validated")
+        logger.info("Configuration validated")
     else:
-        print("⚠️  API key not set - /chat endpoint will not work")
+        logger.warning("API key not set - /chat endpoint will not work")
     
     # Preload RAG service
     try:
         get_rag_service()
-        print("✅ RAG service initialized")
+        logger.info("RAG service initialized")
+    except Exception as e:
+        logger.warning("RAG service initialization failed: %s", e)
+    
+    # Load the upload pipeline (including the embedding model) up front
+    try:
+        get_upload_services()
+        logger.info("Upload pipeline initialized")
     except Exception as e:
-        print(f"⚠️  RAG service initialization failed: {e}")
+        logger.warning("Upload pipeline initialization failed: %s", e)
     
-    print("=" * 80)
-    print(f"🌐 Server running on http://{config.HOST}:{config.PORT}")
-    print("=" * 80)
+    logger.info("Server running on http://%s:%s", config.HOST, config.PORT)
 
 
 if __name__ == "__main__":
@@ -5,7 +5,17 @@ Application metrics and monitoring
 
 from typing import Dict, Any
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
+import math
+import time
+import numpy as np
+
+# Number of recent request timings kept for windowed statistics
+REQUEST_WINDOW = 4096
+# Initial row capacity of the per-endpoint counter table
+ENDPOINT_CAPACITY = 32
+# Status codes are counted in a flat table indexed by code
+MAX_STATUS_CODE = 600
 
 
 class Metrics:
@@ -17,16 +27,31 @@ class Metrics:
         self.total_processing_time = 0
         self.pdfs_processed = 0
         self.embeddings_generated = 0
-        self.start_time = datetime.now()
-        self.request_times = []
-        self.endpoint_metrics = defaultdict(lambda: {"count": 0, "errors": 0, "total_time": 0})
-        self.status_codes = defaultdict(int)
+        self.start_time = datetime.now().isoformat()
+        self._start_ns = time.monotonic_ns()
+        self.request_times = deque(maxlen=REQUEST_WINDOW)
+        self._window_sum = 0.0
+        self._window_sumsq = 0.0
+        # Endpoint counters are stored column-wise, one row per endpoint
+        self._ep_index: Dict[str, int] = {}
+        self._ep_count = np.zeros(ENDPOINT_CAPACITY, dtype=np.uint64)
+        self._ep_errors = np.zeros(ENDPOINT_CAPACITY, dtype=np.uint64)
+        self._ep_time = np.zeros(ENDPOINT_CAPACITY, dtype=np.float64)
+        self._status_counts = np.zeros(MAX_STATUS_CODE, dtype=np.uint64)
         self.user_metrics = defaultdict(lambda: {"requests": 0, "errors": 0})
     
     def record_request(self, processing_time: float, success: bool = True):
         """Record API request"""
         self.requests_count += 1
+        
+        # Keep running window aggregates in step with the ring buffer
+        if len(self.request_times) == self.request_times.maxlen:
+            oldest = self.request_times[0]
+            self._window_sum -= oldest
+            self._window_sumsq -= oldest * oldest
         self.request_times.append(processing_time)
+        self._window_sum += processing_time
+        self._window_sumsq += processing_time * processing_time
         
         if not success:
             self.errors_count += 1
@@ -41,31 +66,73 @@ class Metrics:
         """Record embeddings generated"""
         self.embeddings_generated += count
     
+    def _endpoint_row(self, endpoint: str) -> int:
+        """Get the counter row for an endpoint, growing the table if needed"""
+        idx = self._ep_index.setdefault(endpoint, len(self._ep_index))
+        if idx >= len(self._ep_count):
+            capacity = len(self._ep_count) * 2
+            self._ep_count = np.resize(self._ep_count, capacity)
+            self._ep_errors = np.resize(self._ep_errors, capacity)
+            self._ep_time = np.resize(self._ep_time, capacity)
+            self._ep_count[idx:] = 0
+            self._ep_errors[idx:] = 0
+            self._ep_time[idx:] = 0
+        return idx
+    
     def record_endpoint(self, endpoint: str, processing_time: float, status_code: int, user_id: str = None):
         """Record endpoint-specific metrics"""
-        self.endpoint_metrics[endpoint]["count"] += 1
-        self.endpoint_metrics[endpoint]["total_time"] += processing_time
+        idx = self._endpoint_row(endpoint)
+        self._ep_count[idx] += 1
+        self._ep_time[idx] += processing_time
         if status_code >= 400:
-            self.endpoint_metrics[endpoint]["errors"] += 1
+            self._ep_errors[idx] += 1
         
-        self.status_codes[status_code] += 1
+        if 0 <= status_code < MAX_STATUS_CODE:
+            self._status_counts[status_code] += 1
         
         if user_id:
             self.user_metrics[user_id]["requests"] += 1
             if status_code >= 400:
                 self.user_metrics[user_id]["errors"] += 1
     
+    @property
+    def endpoint_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint counters as plain dicts"""
+        return {
+            endpoint: {
+                "count": int(self._ep_count[idx]),
+                "errors": int(self._ep_errors[idx]),
+                "total_time": float(self._ep_time[idx])
+            }
+            for endpoint, idx in self._ep_index.items()
+        }
+    
+    @property
+    def status_codes(self) -> Dict[int, int]:
+        """Counts of recorded status codes"""
+        codes = np.flatnonzero(self._status_counts)
+        return dict(zip(codes.tolist(), self._status_counts[codes].tolist()))
+    
     def get_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary"""
-        uptime = datetime.now() - self.start_time
+        uptime_seconds = (time.monotonic_ns() - self._start_ns) * 1e-9
         avg_request_time = (
             self.total_processing_time / self.requests_count 
             if self.requests_count > 0 
             else 0
         )
         
+        window = len(self.request_times)
+        window_avg = self._window_sum / window if window else 0
+        window_var = max(0.0, self._window_sumsq / window - window_avg * window_avg) if window else 0
+        if window:
+            samples = np.fromiter(self.request_times, dtype=np.float32, count=window)
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99]).tolist()
+        else:
+            p50 = p95 = p99 = 0
+        
         return {
-            "uptime_seconds": uptime.total_seconds(),
+            "uptime_seconds": uptime_seconds,
             "requests_count": self.requests_count,
             "errors_count": self.errors_count,
             "error_rate": (
@@ -74,22 +141,29 @@ class Metrics:
                 else 0
             ),
             "avg_request_time_ms": round(avg_request_time * 1000, 2),
+            "recent_avg_request_time_ms": round(window_avg * 1000, 2),
+            "recent_stdev_request_time_ms": round(math.sqrt(window_var) * 1000, 2),
+            "p50_request_time_ms": round(p50 * 1000, 2),
+            "p95_request_time_ms": round(p95 * 1000, 2),
+            "p99_request_time_ms": round(p99 * 1000, 2),
             "pdfs_processed": self.pdfs_processed,
             "embeddings_generated": self.embeddings_generated,
-            "endpoint_metrics": dict(self.endpoint_metrics),
-            "status_codes": dict(self.status_codes),
+            "endpoint_metrics": self.endpoint_metrics,
+            "status_codes": self.status_codes,
             "unique_users": len(self.user_metrics)
         }
     
     def get_endpoint_stats(self, endpoint: str) -> Dict[str, Any]:
         """Get statistics for specific endpoint"""
-        metrics = self.endpoint_metrics[endpoint]
-        avg_time = metrics["total_time"] / metrics["count"] if metrics["count"] > 0 else 0
+        idx = self._ep_index.get(endpoint)
+        count = int(self._ep_count[idx]) if idx is not None else 0
+        errors = int(self._ep_errors[idx]) if idx is not None else 0
+        avg_time = float(self._ep_time[idx]) / count if count > 0 else 0
         return {
-            "count": metrics["count"],
-            "errors": metrics["errors"],
+            "count": count,
+            "errors": errors,
             "avg_time_ms": round(avg_time * 1000, 2),
-            "error_rate": (metrics["errors"] / metrics["count"] * 100) if metrics["count"] > 0 else 0
+            "error_rate": (errors / count * 100) if count > 0 else 0
         }
     
     def reset(self):
@@ -97,7 +171,9 @@ class Metrics:
         self.requests_count = 0
         self.errors_count = 0
         self.total_processing_time = 0
-        self.request_times = []
+        self.request_times.clear()
+        self._window_sum = 0.0
+        self._window_sumsq = 0.0
 
 
 # Global metrics instance
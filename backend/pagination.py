@@ -3,8 +3,8 @@ Pagination Module
 Pagination utilities for API responses
 """
 
-from typing import TypeVar, Generic, List, Dict, Any
-from math import ceil
+from typing import TypeVar, Generic, Iterable, Iterator, List, Dict, Any
+from itertools import islice
 
 T = TypeVar('T')
 
@@ -28,14 +28,14 @@ class PaginationParams:
 
 
 class PaginatedResponse(Generic[T]):
-    """Paginated response wrapper"""
+    """Paginated response wrapper (items may be any iterable, e.g. from paginate_iter)"""
     
-    def __init__(self, items: List[T], total: int, page: int, page_size: int):
+    def __init__(self, items: Iterable[T], total: int, page: int, page_size: int):
         self.items = items
         self.total = total
         self.page = page
         self.page_size = page_size
-        self.total_pages = ceil(total / page_size) if page_size > 0 else 1
+        self.total_pages = -(-total // page_size) if page_size > 0 else 1
         self.has_next = page < self.total_pages
         self.has_prev = page > 1
     
@@ -67,3 +67,8 @@ def paginate(items: List[T], params: PaginationParams) -> PaginatedResponse[T]:
         page=params.page,
         page_size=params.page_size
     )
+
+
+def paginate_iter(items: Iterable[T], params: PaginationParams) -> Iterator[T]:
+    """Lazily yield one page of items without copying them"""
+    return islice(items, params.skip, params.skip + params.page_size)
@@ -5,30 +5,100 @@ Handles PDF text extraction and chunking using PyMuPDF
 
 import fitz  # PyMuPDF
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-import json
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import orjson
 import os
-from typing import List, Dict
+import threading
+from typing import Iterator, List, Dict
+
+# Documents shorter than this are extracted in-process
+MIN_PAGES_FOR_PARALLEL = 16
+# Plain-text extraction flags: the TEXTFLAGS_TEXT defaults with ligatures
+# expanded, so "ﬁ" is indexed as "fi"
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+# Streaming chunker splits its buffer once it holds this many chunks of text
+STREAM_WINDOW_CHUNKS = 8
+
+
+def _default_workers() -> int:
+    """Default number of extraction worker processes"""
+    return min(os.cpu_count() or 1, 4)
+
+
+# Extraction worker processes, started on first use and shared by all calls
+_extraction_pool = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Get the shared page extraction pool"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            # Spawned workers start clean instead of forking a server process
+            # that holds the embedding model, logging and OpenMP threads
+            _extraction_pool = ProcessPoolExecutor(
+                max_workers=_default_workers(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _extraction_pool
+
+
+def _reset_extraction_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one"""
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is pool:
+            _extraction_pool = None
+    pool.shutdown(wait=False)
+
+
+def _page_text(page) -> str:
+    """Extract a page's plain text through a single-use TextPage"""
+    return page.get_textpage(flags=TEXT_FLAGS).extractText()
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop); runs in a worker process"""
+    # Each worker opens its own Document, since fitz objects can't be shared
+    doc = fitz.open(pdf_path)
+    try:
+        return [_page_text(doc[page_num]) for page_num in range(start, stop)]
+    finally:
+        doc.close()
 
 
 class PDFProcessor:
     """Extract and process text from PDF files"""
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200, fast: bool = False):
         """
         Initialize PDF processor
         
         Args:
             chunk_size: Maximum size of each text chunk
             chunk_overlap: Number of characters to overlap between chunks
+            fast: Use chonkie's FastChunker (requires the optional chonkie
+                package; chunks are split on delimiters without overlap)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=chunk_overlap,
-            length_function=len,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
+        self.fast = fast
+        self.text_splitter = None
+        self.fast_chunker = None
+        
+        if fast:
+            from chonkie import FastChunker
+            self.fast_chunker = FastChunker(chunk_size=chunk_size, delimiters="\n.?")
+        else:
+            self.text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                length_function=len,
+                separators=["\n\n", "\n", ". ", " ", ""]
+            )
     
     def extract_metadata_from_pdf(self, pdf_path: str) -> Dict:
         """
@@ -56,37 +126,82 @@ class PDFProcessor:
         doc.close()
         return metadata
 
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def _iter_page_texts(self, pdf_path: str, num_workers: int = None) -> Iterator[str]:
+        """Yield page texts in order, extracting large documents in parallel"""
+        if num_workers is None:
+            num_workers = _default_workers()
+        
+        # Small documents are read straight from the one open Document
+        doc = fitz.open(pdf_path)
+        try:
+            total_pages = len(doc)
+            if num_workers <= 1 or total_pages < MIN_PAGES_FOR_PARALLEL:
+                for page in doc:
+                    yield _page_text(page)
+                return
+        finally:
+            doc.close()
+        
+        # Split large documents into contiguous page ranges handled by
+        # separate processes; executor.map yields them back in order
+        step = -(-total_pages // num_workers)
+        starts = list(range(0, total_pages, step))
+        stops = [min(start + step, total_pages) for start in starts]
+        executor = _get_extraction_pool()
+        try:
+            for segment in executor.map(
+                _extract_page_range, [pdf_path] * len(starts), starts, stops
+            ):
+                yield from segment
+        except BrokenProcessPool:
+            _reset_extraction_pool(executor)
+            raise
+    
+    def _iter_page_sections(self, pdf_path: str, num_workers: int = None) -> Iterator[str]:
+        """Yield page markers and page texts in document order"""
+        for page_num, text in enumerate(self._iter_page_texts(pdf_path, num_workers)):
+            yield f"\n--- Page {page_num + 1} ---\n"
+            yield text
+    
+    def extract_text_from_pdf(self, pdf_path: str, num_workers: int = None) -> str:
         """
         Extract all text from a PDF file using PyMuPDF
         
         Args:
             pdf_path: Path to the PDF file
+            num_workers: Worker processes for page extraction (default: min(cpu_count, 4))
             
         Returns:
             Extracted text as a single string
         """
         print(f"📄 Opening PDF: {pdf_path}")
         
-        # Open the PDF
-        doc = fitz.open(pdf_path)
-        
-        full_text = ""
-        
-        # Extract text from each page
-        total_pages = len(doc)
-        for page_num in range(total_pages):
-            page = doc[page_num]
-            text = page.get_text()
-            full_text += f"\n--- Page {page_num + 1} ---\n"
-            full_text += text
-        
-        print(f"✅ Extracted {len(full_text)} characters from {total_pages} pages")
+        parts = list(self._iter_page_sections(pdf_path, num_workers))
+        full_text = "".join(parts)
         
-        doc.close()
+        print(f"✅ Extracted {len(full_text)} characters from {len(parts) // 2} pages")
         
         return full_text
     
+    def _split(self, text: str) -> List[str]:
+        """Split text with the configured chunker"""
+        if self.fast_chunker is not None:
+            return [
+                text[chunk.start_index:chunk.end_index]
+                for chunk in self.fast_chunker.chunk(text)
+            ]
+        return self.text_splitter.split_text(text)
+    
+    @staticmethod
+    def _chunk_object(idx: int, chunk_text: str) -> Dict[str, any]:
+        """Build the structured record for one chunk"""
+        return {
+            "id": f"chunk_{idx:04d}",
+            "text": chunk_text,
+            "chunk_index": idx,
+            "char_count": len(chunk_text)
+        }
+    
     def chunk_text(self, text: str) -> List[Dict[str, any]]:
         """
         Split text into chunks for RAG retrieval
@@ -99,46 +214,80 @@ class PDFProcessor:
         """
         print(f"✂️  Chunking text...")
         
-        # Split text into chunks
-        chunks = self.text_splitter.split_text(text)
-        
-        # Create structured chunk objects
-        chunk_objects = []
-        for idx, chunk_text in enumerate(chunks):
-            chunk_obj = {
-                "id": f"chunk_{idx:04d}",
-                "text": chunk_text,
-                "chunk_index": idx,
-                "char_count": len(chunk_text)
-            }
-            chunk_objects.append(chunk_obj)
+        # Split text into chunks and create structured chunk objects
+        chunk_objects = [
+            self._chunk_object(idx, chunk_text)
+            for idx, chunk_text in enumerate(self._split(text))
+        ]
         
         print(f"✅ Created {len(chunk_objects)} chunks")
         
         return chunk_objects
     
-    def process_pdf(self, pdf_path: str, output_path: str = None) -> List[Dict[str, any]]:
+    def iter_chunks(self, pdf_path: str, num_workers: int = None) -> Iterator[Dict[str, any]]:
+        """
+        Stream chunk dictionaries for a PDF without holding its full text
+        
+        Page text is appended to a buffer that is split once it holds
+        STREAM_WINDOW_CHUNKS chunks' worth of text; every chunk except the
+        last is emitted and the last one is carried over as the start of
+        the next window.
+        
+        Args:
+            pdf_path: Path to PDF file
+            num_workers: Worker processes for page extraction
+            
+        Yields:
+            Chunk dictionaries with id, text, and metadata
+        """
+        window = self.chunk_size * STREAM_WINDOW_CHUNKS
+        parts = []
+        buffered = 0
+        idx = 0
+        
+        for section in self._iter_page_sections(pdf_path, num_workers):
+            parts.append(section)
+            buffered += len(section)
+            if buffered < window:
+                continue
+            
+            pieces = self._split("".join(parts))
+            for chunk_text in pieces[:-1]:
+                yield self._chunk_object(idx, chunk_text)
+                idx += 1
+            parts = pieces[-1:]
+            buffered = sum(len(piece) for piece in parts)
+        
+        if parts:
+            for chunk_text in self._split("".join(parts)):
+                yield self._chunk_object(idx, chunk_text)
+                idx += 1
+    
+    def process_pdf(self, pdf_path: str, output_path: str = None,
+                    num_workers: int = None) -> List[Dict[str, any]]:
         """
         Complete pipeline: Extract text and create chunks
         
         Args:
             pdf_path: Path to PDF file
             output_path: Optional path to save chunks as JSON
+            num_workers: Worker processes for page extraction
             
         Returns:
             List of text chunks
         """
-        # Extract text
-        full_text = self.extract_text_from_pdf(pdf_path)
+        print(f"📄 Opening PDF: {pdf_path}")
+        
+        # Extract and chunk page by page
+        chunks = list(self.iter_chunks(pdf_path, num_workers=num_workers))
         
-        # Create chunks
-        chunks = self.chunk_text(full_text)
+        print(f"✅ Created {len(chunks)} chunks")
         
         # Save to JSON if output path provided
         if output_path:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(chunks, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(chunks, option=orjson.OPT_INDENT_2))
             print(f"💾 Saved chunks to: {output_path}")
         
         return chunks
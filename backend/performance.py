@@ -5,6 +5,7 @@ Application performance monitoring and profiling
 
 from typing import Dict, Any
 from datetime import datetime
+import math
 import time
 from logger import logger
 
@@ -13,48 +14,61 @@ class PerformanceTracker:
     """Track performance metrics"""
     
     def __init__(self):
-        self.metrics = {}
+        # Running stats per operation: count, min, max, total, mean, m2
+        self.metrics: Dict[str, Dict[str, float]] = {}
         self.start_times = {}
     
     def start_timer(self, name: str):
         """Start a performance timer"""
-        self.start_times[name] = time.time()
+        self.start_times[name] = time.perf_counter()
     
     def end_timer(self, name: str) -> float:
         """End a performance timer and return elapsed time"""
         if name not in self.start_times:
             return 0
         
-        elapsed = time.time() - self.start_times[name]
+        elapsed = time.perf_counter() - self.start_times.pop(name)
         
-        if name not in self.metrics:
-            self.metrics[name] = []
+        m = self.metrics.get(name)
+        if m is None:
+            m = self.metrics[name] = {
+                "count": 0, "min": elapsed, "max": elapsed,
+                "total": 0.0, "mean": 0.0, "m2": 0.0
+            }
         
-        self.metrics[name].append(elapsed)
-        del self.start_times[name]
+        # Welford's online update keeps mean and variance without storing samples
+        m["count"] += 1
+        m["total"] += elapsed
+        delta = elapsed - m["mean"]
+        m["mean"] += delta / m["count"]
+        m["m2"] += delta * (elapsed - m["mean"])
+        if elapsed < m["min"]:
+            m["min"] = elapsed
+        if elapsed > m["max"]:
+            m["max"] = elapsed
         
         return elapsed
     
     def get_average(self, name: str) -> float:
         """Get average time for operation"""
-        if name not in self.metrics or not self.metrics[name]:
+        if name not in self.metrics:
             return 0
         
-        times = self.metrics[name]
-        return sum(times) / len(times)
+        return self.metrics[name]["mean"]
     
     def get_stats(self, name: str) -> Dict[str, Any]:
         """Get statistics for operation"""
-        if name not in self.metrics or not self.metrics[name]:
+        if name not in self.metrics:
             return {"count": 0}
         
-        times = self.metrics[name]
+        m = self.metrics[name]
         return {
-            "count": len(times),
-            "min": min(times),
-            "max": max(times),
-            "avg": sum(times) / len(times),
-            "total": sum(times)
+            "count": m["count"],
+            "min": m["min"],
+            "max": m["max"],
+            "avg": m["mean"],
+            "stddev": math.sqrt(m["m2"] / m["count"]),
+            "total": m["total"]
         }
     
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
@@ -1,9 +1,11 @@
 """
-Queue Module
+Priority Queue Module
 Priority queue and task ordering
 """
 
+import asyncio
 import heapq
+from itertools import count
 from typing import List, Tuple, Any, Callable, Optional
 from datetime import datetime
 from enum import Enum
@@ -20,7 +22,7 @@ class Priority(int, Enum):
 class QueuedTask:
     """Task in queue"""
     
-    _counter = 0
+    _counter = count()
     
     def __init__(
         self,
@@ -36,19 +38,11 @@ class QueuedTask:
         self.args = args
         self.kwargs = kwargs
         self.created_at = datetime.now()
-        self._order = QueuedTask._counter
-        QueuedTask._counter += 1
-    
-    def __lt__(self, other):
-        """Comparison for heapq"""
-        if self.priority == other.priority:
-            return self._order < other._order
-        return self.priority < other.priority
+        self._order = next(QueuedTask._counter)
     
     async def execute(self):
         """Execute the task"""
         if hasattr(self.func, '__call__'):
-            import asyncio
             if asyncio.iscoroutinefunction(self.func):
                 return await self.func(*self.args, **self.kwargs)
             else:
@@ -59,7 +53,10 @@ class PriorityQueue:
     """Priority queue for tasks"""
     
     def __init__(self):
-        self.queue: List[QueuedTask] = []
+        # Heap of (priority, order, task) so heapq compares plain ints
+        self.queue: List[Tuple[int, int, QueuedTask]] = []
+        # Created lazily inside the running loop by the first get()
+        self._not_empty: Optional[asyncio.Event] = None
     
     def enqueue(
         self,
@@ -71,19 +68,30 @@ class PriorityQueue:
     ):
         """Add task to queue"""
         task = QueuedTask(priority, task_id, func, *args, **kwargs)
-        heapq.heappush(self.queue, task)
+        heapq.heappush(self.queue, (int(priority), task._order, task))
+        if self._not_empty is not None:
+            self._not_empty.set()
     
     def dequeue(self) -> Optional[QueuedTask]:
         """Remove and return highest priority task"""
         if not self.queue:
             return None
-        return heapq.heappop(self.queue)
+        return heapq.heappop(self.queue)[2]
+    
+    async def get(self) -> QueuedTask:
+        """Wait until a task is available, then remove and return it"""
+        while not self.queue:
+            if self._not_empty is None:
+                self._not_empty = asyncio.Event()
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return heapq.heappop(self.queue)[2]
     
     def peek(self) -> Optional[QueuedTask]:
         """View highest priority task without removing"""
         if not self.queue:
             return None
-        return self.queue[0]
+        return self.queue[0][2]
     
     def size(self) -> int:
         """Get queue size"""
@@ -105,11 +113,13 @@ class QueueWorker:
         self.queue = queue
         self.num_workers = num_workers
         self.running = False
+        # Created in start() so it binds to the running loop
+        self._stop: Optional[asyncio.Event] = None
     
     async def start(self):
         """Start workers"""
         self.running = True
-        import asyncio
+        self._stop = asyncio.Event()
         
         workers = [
             asyncio.create_task(self._worker())
@@ -120,18 +130,29 @@ class QueueWorker:
     
     async def _worker(self):
         """Worker coroutine"""
-        while self.running:
-            task = self.queue.dequeue()
-            
-            if task:
+        # Wait on the next task and the stop signal together, so workers
+        # sleep until there is work and exit as soon as stop() is called
+        stop_wait = asyncio.ensure_future(self._stop.wait())
+        try:
+            while not self._stop.is_set():
+                get_task = asyncio.ensure_future(self.queue.get())
+                await asyncio.wait(
+                    {get_task, stop_wait}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get_task.done():
+                    get_task.cancel()
+                    break
+                
+                task = get_task.result()
                 try:
                     await task.execute()
                 except Exception as e:
                     print(f"Task {task.task_id} failed: {str(e)}")
-            else:
-                import asyncio
-                await asyncio.sleep(0.1)
+        finally:
+            stop_wait.cancel()
     
     def stop(self):
         """Stop workers"""
         self.running = False
+        if self._stop is not None:
+            self._stop.set()
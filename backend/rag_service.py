@@ -3,13 +3,36 @@ RAG Service Module
 Handles retrieval augmented generation logic
 """
 
+import functools
 import json
 import requests
-from typing import List, Dict, Tuple
-from embedding_generator import EmbeddingGenerator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterator, List, Dict, Tuple
+from cache import Cache
+from embedding_generator import get_embedding_generator
 from vector_store import VectorStore
 from config import config
 
+# Memoization limits for repeated questions
+RETRIEVAL_CACHE_SIZE = 1024
+ANSWER_CACHE_SIZE = 1024
+ANSWER_CACHE_TTL = 300  # seconds
+
+
+# Shared HTTP session so OpenRouter connections (TCP + TLS) are kept alive
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for cache lookups (case and whitespace)"""
+    return " ".join(question.lower().split())
+
 
 class RAGService:
     """RAG service for question answering with context"""
@@ -18,13 +41,19 @@ class RAGService:
         """Initialize RAG components"""
         print("🔧 Initializing RAG Service...")
         
-        # Load embedding generator
-        self.generator = EmbeddingGenerator()
+        # Shared embedding generator (model is loaded once per process)
+        self.generator = get_embedding_generator()
         
         # Load vector store
         self.vector_store = VectorStore(embedding_dim=384)
         self.vector_store.load_indices(config.EMBEDDINGS_DIR)
         
+        # Per-instance memoization of retrieval and of complete answers
+        self._cached_retrieval = functools.lru_cache(maxsize=RETRIEVAL_CACHE_SIZE)(
+            self._retrieve_normalized
+        )
+        self._answer_cache = Cache(max_size=ANSWER_CACHE_SIZE)
+        
         print("✅ RAG Service ready!")
     
     def retrieve_context(self, question: str) -> Tuple[List[Dict], List[Dict]]:
@@ -37,6 +66,10 @@ class RAGService:
         Returns:
             Tuple of (text_chunks, images)
         """
+        return self._cached_retrieval(normalize_question(question))
+    
+    def _retrieve_normalized(self, question: str) -> Tuple[List[Dict], List[Dict]]:
+        """Embed a normalized question and search both indices"""
         # Generate query embedding
         query_embedding = self.generator.generate_query_embedding(question)
         
@@ -65,6 +98,12 @@ class RAGService:
         Returns:
             Generated answer
         """
+        return self._generate_answer(question, context_chunks)[0]
+    
+    def _build_request(
+        self, question: str, context_chunks: List[Dict], stream: bool = False
+    ) -> Dict:
+        """Build the OpenRouter request body for a question and its context"""
         # Build context from chunks
         context_text = "\n\n".join([
             f"Context {i+1}:\n{chunk['text']}"
@@ -97,31 +136,41 @@ Student's Question: {question}
 
 Instructions: Answer this question using ONLY the information provided in the context above. Do not use any external knowledge. If the context doesn't contain the answer, say "I don't have that information in this chapter." """
 
+        return {
+            "model": config.MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": 500,
+            "stream": stream
+        }
+    
+    @staticmethod
+    def _request_headers() -> Dict[str, str]:
+        """HTTP headers for OpenRouter requests"""
+        return {
+            "Authorization": f"Bearer {config.OPENROUTER_API_KEY}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "http://localhost:8000",
+            "X-Title": "AI Tutor RAG System"
+        }
+    
+    def _generate_answer(self, question: str, context_chunks: List[Dict]) -> Tuple[str, bool]:
+        """Generate an answer, also reporting whether it came from the LLM"""
         # Call OpenRouter API
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 config.OPENROUTER_API_URL,
-                headers={
-                    "Authorization": f"Bearer {config.OPENROUTER_API_KEY}",
-                    "Content-Type": "application/json",
-                    "HTTP-Referer": "http://localhost:8000",
-                    "X-Title": "AI Tutor RAG System"
-                },
-                json={
-                    "model": config.MODEL_NAME,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": system_prompt
-                        },
-                        {
-                            "role": "user",
-                            "content": user_prompt
-                        }
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 500
-                },
+                headers=self._request_headers(),
+                json=self._build_request(question, context_chunks),
                 timeout=60  # Increased timeout for reliability
             )
             
@@ -129,15 +178,72 @@ Instructions: Answer this question using ONLY the information provided in the co
             result = response.json()
             
             answer = result["choices"][0]["message"]["content"]
-            return answer
+            return answer, True
             
         except requests.exceptions.Timeout:
             print(f"⏱️ Timeout calling OpenRouter API")
-            return self._generate_fallback_answer(question, context_chunks, "timeout")
+            return self._generate_fallback_answer(question, context_chunks, "timeout"), False
+            
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Error calling OpenRouter API: {e}")
+            return self._generate_fallback_answer(question, context_chunks, "error"), False
+    
+    def generate_answer_stream(self, question: str, context_chunks: List[Dict]) -> Iterator[str]:
+        """
+        Stream an answer from the LLM as it is generated
+        
+        Args:
+            question: User's question
+            context_chunks: Retrieved text chunks
+            
+        Yields:
+            Answer text fragments (or the fallback answer if the API fails
+            before any text was produced)
+        """
+        streamed = False
+        try:
+            with _SESSION.post(
+                config.OPENROUTER_API_URL,
+                headers=self._request_headers(),
+                json=self._build_request(question, context_chunks, stream=True),
+                timeout=60,
+                stream=True
+            ) as response:
+                response.raise_for_status()
+                
+                # Server-sent events: one "data: {...}" frame per delta
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith("data: "):
+                        continue
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        delta = json.loads(data)["choices"][0].get("delta") or {}
+                    except (ValueError, KeyError, IndexError, TypeError):
+                        # Malformed or error frame (e.g. no "choices"); skip it
+                        print(f"⚠️ Skipping unparseable stream frame: {data[:200]}")
+                        continue
+                    content = delta.get("content")
+                    if content:
+                        streamed = True
+                        yield content
+                        
+        except requests.exceptions.Timeout:
+            print("⏱️ Timeout calling OpenRouter API")
+            # Don't tack the fallback onto a partially streamed answer
+            if not streamed:
+                yield self._generate_fallback_answer(question, context_chunks, "timeout")
             
         except requests.exceptions.RequestException as e:
             print(f"❌ Error calling OpenRouter API: {e}")
-            return self._generate_fallback_answer(question, context_chunks, "error")
+            if not streamed:
+                yield self._generate_fallback_answer(question, context_chunks, "error")
+        
+        else:
+            if not streamed:
+                # Stream ended without any text (e.g. only error frames)
+                yield self._generate_fallback_answer(question, context_chunks, "error")
     
     def _generate_fallback_answer(self, question: str, context_chunks: List[Dict], reason: str) -> str:
         """Generate fallback answer when API fails"""
@@ -167,13 +273,19 @@ This should help answer your question about: {question}"""
         """
         print(f"\n🔍 Processing question: {question}")
         
+        # Serve repeated questions straight from the answer cache
+        key = normalize_question(question)
+        cached = self._answer_cache.get(key)
+        if cached is not None:
+            return {**cached, "question": question}
+        
         # Retrieve context
         text_chunks, images = self.retrieve_context(question)
         
         print(f"✅ Retrieved {len(text_chunks)} chunks and {len(images)} image(s)")
         
         # Generate answer
-        answer = self.generate_answer(question, text_chunks)
+        answer, from_llm = self._generate_answer(question, text_chunks)
         
         print(f"✅ Generated answer ({len(answer)} chars)")
         
@@ -192,6 +304,10 @@ This should help answer your question about: {question}"""
             "image": images[0] if images else None
         }
         
+        # Fallback answers are not cached so the next request retries the LLM
+        if from_llm:
+            self._answer_cache.set(key, response, ttl_seconds=ANSWER_CACHE_TTL)
+        
         return response
 
 
@@ -4,8 +4,9 @@ API rate limiting for request throttling
 """
 
 from typing import Dict, Tuple
-from datetime import datetime, timedelta
-from collections import defaultdict
+import math
+import time
+from fastapi import HTTPException
 
 
 class RateLimiter:
@@ -14,43 +15,43 @@ class RateLimiter:
     def __init__(self, requests_per_minute: int = 60):
         self.requests_per_minute = requests_per_minute
         self.window_size = 60  # seconds
-        self.requests: Dict[str, list] = defaultdict(list)
-        self.user_requests: Dict[str, list] = defaultdict(list)  # Track per user
+        self.refill_rate = requests_per_minute / self.window_size  # tokens per second
+        # Each bucket is (tokens, last_refill_monotonic)
+        self.buckets: Dict[str, Tuple[float, float]] = {}
+        self.user_buckets: Dict[str, Tuple[float, float]] = {}  # Track per user
     
     def is_allowed(self, client_id: str, user_id: str = None) -> Tuple[bool, dict]:
         """Check if request is allowed for client or user"""
-        now = datetime.now()
-        window_start = now - timedelta(seconds=self.window_size)
+        now = time.monotonic()
+        capacity = self.requests_per_minute
         
         # Check user-specific limit if user_id provided
         check_id = user_id if user_id else client_id
-        request_store = self.user_requests if user_id else self.requests
+        bucket_store = self.user_buckets if user_id else self.buckets
         
-        # Remove old requests outside window
-        request_store[check_id] = [
-            req_time for req_time in request_store[check_id]
-            if req_time > window_start
-        ]
+        # Refill tokens for the time elapsed since the last request
+        tokens, last = bucket_store.get(check_id, (capacity, now))
+        tokens = min(capacity, tokens + (now - last) * self.refill_rate)
         
-        request_count = len(request_store[check_id])
-        
-        if request_count >= self.requests_per_minute:
-            oldest_request = request_store[check_id][0]
-            reset_time = oldest_request + timedelta(seconds=self.window_size)
-            wait_seconds = (reset_time - now).total_seconds()
+        if tokens < 1:
+            bucket_store[check_id] = (tokens, now)
+            wait_seconds = (1 - tokens) / self.refill_rate
             
             return False, {
                 "remaining": 0,
-                "reset_in_seconds": max(0, int(wait_seconds)),
+                # Round up so clients never retry before a token is back;
+                # round() first absorbs float noise like 5.9999999
+                "reset_in_seconds": max(1, math.ceil(round(wait_seconds, 6))),
                 "user_id": user_id
             }
         
-        # Add new request
-        request_store[check_id].append(now)
+        # Consume a token for this request
+        tokens -= 1
+        bucket_store[check_id] = (tokens, now)
         
         return True, {
-            "remaining": self.requests_per_minute - request_count - 1,
-            "reset_in_seconds": self.window_size,
+            "remaining": int(tokens),
+            "reset_in_seconds": int((capacity - tokens) / self.refill_rate),
             "user_id": user_id
         }
 
@@ -69,7 +70,6 @@ def rate_limit(requests_per_minute: int = 60):
             allowed, info = limiter.is_allowed(client_id)
             
             if not allowed:
-                from fastapi import HTTPException
                 raise HTTPException(
                     status_code=429,
                     detail=f"Rate limit exceeded. Try again in {info['reset_in_seconds']}s"
@@ -81,7 +81,6 @@ def rate_limit(requests_per_minute: int = 60):
             allowed, info = limiter.is_allowed("default")
             
             if not allowed:
-                from fastapi import HTTPException
                 raise HTTPException(
                     status_code=429,
                     detail=f"Rate limit exceeded. Try again in {info['reset_in_seconds']}s"
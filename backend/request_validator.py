@@ -3,9 +3,14 @@ Request Validation Module
 Comprehensive request validation
 """
 
+import re
 from typing import Dict, Any, List, Tuple
 from pydantic import BaseModel, Field, validator
 
+EMAIL_PATTERN = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+_SPECIAL_CHARS = frozenset('!@#$%^&*')
+
 
 class UploadRequest(BaseModel):
     """PDF upload request model"""
@@ -27,7 +32,7 @@ class ChatRequest(BaseModel):
 
 class UserRequest(BaseModel):
     """User request model"""
-    email: str = Field(..., regex=r'^[\w\.-]+@[\w\.-]+\.\w+$')
+    email: str = Field(..., pattern=EMAIL_PATTERN)
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8, max_length=100)
 
@@ -51,9 +56,7 @@ class RequestValidator:
     @staticmethod
     def validate_email(email: str) -> Tuple[bool, str]:
         """Validate email format"""
-        import re
-        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        if not re.match(pattern, email):
+        if not _EMAIL_RE.match(email):
             return False, "Invalid email format"
         return True, ""
     
@@ -62,15 +65,31 @@ class RequestValidator:
         """Validate password strength"""
         issues = []
         
+        # Single pass over the password, stopping once every class is seen
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif c in _SPECIAL_CHARS:
+                has_special = True
+            else:
+                continue
+            if has_upper and has_lower and has_digit and has_special:
+                break
+        
         if len(password) < 8:
             issues.append("Password must be at least 8 characters")
-        if not any(c.isupper() for c in password):
+        if not has_upper:
             issues.append("Password must contain uppercase letter")
-        if not any(c.islower() for c in password):
+        if not has_lower:
             issues.append("Password must contain lowercase letter")
-        if not any(c.isdigit() for c in password):
+        if not has_digit:
             issues.append("Password must contain number")
-        if not any(c in '!@#$%^&*' for c in password):
+        if not has_special:
             issues.append("Password must contain special character")
         
         return len(issues) == 0, issues
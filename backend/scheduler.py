@@ -4,7 +4,10 @@ Task scheduling and cron jobs
 """
 
 import asyncio
-from typing import Callable, Optional
+import heapq
+import time
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from logger import logger
 
@@ -17,15 +20,33 @@ class ScheduledTask:
         name: str,
         func: Callable,
         interval_seconds: int,
-        run_immediately: bool = False
+        run_immediately: bool = False,
+        on_change: Optional[Callable[[], None]] = None
     ):
         self.name = name
         self.func = func
         self.interval_seconds = interval_seconds
         self.run_immediately = run_immediately
         self.last_run = None
-        self.next_run = datetime.now() if run_immediately else datetime.now() + timedelta(seconds=interval_seconds)
+        self.next_run = None
+        self.next_run_monotonic = None
+        self.set_next_run(0 if run_immediately else interval_seconds)
         self.is_running = False
+        self.on_change = on_change
+        self.last_run_iso = None
+        self.next_run_iso = self.next_run.isoformat()
+    
+    def set_next_run(self, delay_seconds: float):
+        """Set the next run time; next_run is the wall-clock view of the heap key"""
+        self.next_run_monotonic = time.monotonic() + delay_seconds
+        self.next_run = datetime.now() + timedelta(seconds=delay_seconds)
+    
+    def mark_changed(self):
+        """Refresh cached timestamps and notify the owner of a state change"""
+        self.last_run_iso = self.last_run.isoformat() if self.last_run else None
+        self.next_run_iso = self.next_run.isoformat()
+        if self.on_change is not None:
+            self.on_change()
     
     async def should_run(self) -> bool:
         """Check if task should run"""
@@ -38,6 +59,7 @@ class ScheduledTask:
         
         try:
             self.is_running = True
+            self.mark_changed()
             logger.info(f"Executing scheduled task: {self.name}")
             
             if asyncio.iscoroutinefunction(self.func):
@@ -46,12 +68,14 @@ class ScheduledTask:
                 self.func()
             
             self.last_run = datetime.now()
-            self.next_run = self.last_run + timedelta(seconds=self.interval_seconds)
             logger.info(f"Scheduled task completed: {self.name}")
         except Exception as e:
             logger.error(f"Scheduled task failed: {self.name} - {str(e)}")
         finally:
+            # Fixed delay: the next run is counted from when this one finished
+            self.set_next_run(self.interval_seconds)
             self.is_running = False
+            self.mark_changed()
 
 
 class Scheduler:
@@ -60,6 +84,13 @@ class Scheduler:
     def __init__(self):
         self.tasks = {}
         self.running = False
+        # Min-heap of (next_run_monotonic, order, task); removed or replaced
+        # tasks are skipped lazily when they reach the top
+        self._heap: List[Tuple[float, int, ScheduledTask]] = []
+        self._order = count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._status_cache: Optional[Dict[str, Dict[str, Any]]] = None
     
     def add_task(
         self,
@@ -69,47 +100,99 @@ class Scheduler:
         run_immediately: bool = False
     ):
         """Add scheduled task"""
-        task = ScheduledTask(name, func, interval_seconds, run_immediately)
+        task = ScheduledTask(
+            name, func, interval_seconds, run_immediately,
+            on_change=self._invalidate_status
+        )
         self.tasks[name] = task
+        self._invalidate_status()
+        self._push(task)
         logger.info(f"Task scheduled: {name} (every {interval_seconds}s)")
     
+    def _push(self, task: ScheduledTask):
+        """Queue a task at its next run time and wake the loop"""
+        heapq.heappush(self._heap, (task.next_run_monotonic, next(self._order), task))
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _sleep_until_due(self, delay: Optional[float]):
+        """Sleep for delay seconds (or indefinitely), waking early on changes"""
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+    
+    def _dispatch(self, task: ScheduledTask):
+        """Run a due task concurrently; it is requeued once the run finishes"""
+        running = asyncio.create_task(task.execute())
+        self._in_flight.add(running)
+        running.add_done_callback(lambda done: self._on_run_done(done, task))
+    
+    def _on_run_done(self, running: asyncio.Task, task: ScheduledTask):
+        """Requeue a task at the next run time execute() set, unless it was removed"""
+        self._in_flight.discard(running)
+        if self.tasks.get(task.name) is task:
+            self._push(task)
+    
     async def start(self):
         """Start scheduler"""
         self.running = True
+        self._wakeup = asyncio.Event()
         logger.info("Scheduler started")
         
         while self.running:
-            for task in self.tasks.values():
-                if await task.should_run():
-                    await task.execute()
+            if not self._heap:
+                await self._sleep_until_due(None)
+                continue
+            
+            due, _, task = self._heap[0]
+            if self.tasks.get(task.name) is not task:
+                heapq.heappop(self._heap)
+                continue
             
-            await asyncio.sleep(1)  # Check every second
+            delay = due - time.monotonic()
+            if delay > 0:
+                await self._sleep_until_due(delay)
+                continue
+            
+            heapq.heappop(self._heap)
+            self._dispatch(task)
     
     def stop(self):
         """Stop scheduler"""
         self.running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
         logger.info("Scheduler stopped")
     
     def remove_task(self, name: str) -> bool:
         """Remove scheduled task"""
         if name in self.tasks:
             del self.tasks[name]
+            self._invalidate_status()
             logger.info(f"Task removed: {name}")
             return True
         return False
     
+    def _invalidate_status(self):
+        """Drop the cached status snapshot"""
+        self._status_cache = None
+    
     def get_tasks_status(self):
-        """Get all tasks status"""
-        return {
-            name: {
-                "name": task.name,
-                "interval_seconds": task.interval_seconds,
-                "last_run": task.last_run.isoformat() if task.last_run else None,
-                "next_run": task.next_run.isoformat(),
-                "is_running": task.is_running
+        """Get all tasks status (cached until a task changes)"""
+        if self._status_cache is None:
+            self._status_cache = {
+                name: {
+                    "name": task.name,
+                    "interval_seconds": task.interval_seconds,
+                    "last_run": task.last_run_iso,
+                    "next_run": task.next_run_iso,
+                    "is_running": task.is_running
+                }
+                for name, task in self.tasks.items()
             }
-            for name, task in self.tasks.items()
-        }
+        return self._status_cache
 
 
 # Global scheduler instance
@@ -3,11 +3,39 @@ Database Schema
 Defines data models and database structure
 """
 
-from typing import List, Dict, Any
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable
+from dataclasses import dataclass, fields
 from datetime import datetime
+import numpy as np
 
 
+def _dataclass_getstate(self):
+    """Pickle state of a slotted dataclass as a list of field values"""
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    """Restore field values, bypassing the frozen __setattr__"""
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    if cls.__dataclass_params__.frozen:
+        # Default slot restoration uses setattr, which frozen classes reject
+        namespace.setdefault("__getstate__", _dataclass_getstate)
+        namespace.setdefault("__setstate__", _dataclass_setstate)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass
 class PDFMetadata:
     """PDF file metadata"""
@@ -20,7 +48,8 @@ class PDFMetadata:
     error_message: str = None
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class TextChunk:
     """Text chunk from PDF"""
     chunk_id: str
@@ -30,7 +59,51 @@ class TextChunk:
     embedding_id: str = None
 
 
-@dataclass
+class TextChunkTable:
+    """Column-oriented storage of text chunks for bulk filtering"""
+    
+    def __init__(self, chunks: Iterable[TextChunk] = ()):
+        chunks = list(chunks)
+        self.chunk_ids = np.array([c.chunk_id for c in chunks], dtype=object)
+        self.pdf_filenames = np.array([c.pdf_filename for c in chunks], dtype=object)
+        self.pages = np.fromiter(
+            (c.page_number for c in chunks), dtype=np.int32, count=len(chunks)
+        )
+        self.contents: List[str] = [c.content for c in chunks]
+        self.embedding_ids = np.array([c.embedding_id for c in chunks], dtype=object)
+    
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[TextChunk]) -> "TextChunkTable":
+        """Build a table from TextChunk rows"""
+        return cls(chunks)
+    
+    def __len__(self) -> int:
+        return len(self.contents)
+    
+    def to_chunk(self, i: int) -> TextChunk:
+        """Materialize row i as a TextChunk"""
+        return TextChunk(
+            chunk_id=self.chunk_ids[i],
+            pdf_filename=self.pdf_filenames[i],
+            page_number=int(self.pages[i]),
+            content=self.contents[i],
+            embedding_id=self.embedding_ids[i]
+        )
+    
+    def mask_for_pdf(self, pdf_filename: str) -> np.ndarray:
+        """Boolean mask of rows belonging to a PDF"""
+        return self.pdf_filenames == pdf_filename
+    
+    def take(self, indices) -> List[TextChunk]:
+        """Materialize the rows selected by indices or a boolean mask"""
+        indices = np.asarray(indices)
+        if indices.dtype == bool:
+            indices = np.flatnonzero(indices)
+        return [self.to_chunk(int(i)) for i in indices]
+
+
+@_slotted
+@dataclass(frozen=True)
 class ImageData:
     """Image metadata from PDF"""
     image_id: str
@@ -41,7 +114,8 @@ class ImageData:
     embedding_id: str = None
 
 
-@dataclass
+@_slotted
+@dataclass(frozen=True)
 class ChatMessage:
     """Chat message in conversation"""
     message_id: str
@@ -6,41 +6,58 @@ CORS, HTTPS, and security headers configuration
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
+from config import config
+
 
 def setup_cors(app):
     """Configure CORS middleware"""
-    allowed_origins = [
-        "http://localhost:3000",
-        "http://localhost:5500",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5500",
-    ]
-    
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=allowed_origins,
+        allow_origins=sorted(set(config.ALLOWED_ORIGINS)),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
 
+# Raw header pairs added to every HTTP response
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+]
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in _SECURITY_HEADERS)
+
+
+class SecurityHeadersMiddleware:
+    """ASGI middleware adding security headers to HTTP responses"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                # Replace any values the app already set, as the old middleware did
+                headers = [
+                    (name, value) for name, value in message.get("headers", ())
+                    if name.lower() not in _SECURITY_HEADER_NAMES
+                ]
+                headers.extend(_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
+
+
 def setup_security_headers(app):
     """Configure security headers middleware"""
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["localhost", "127.0.0.1"])
-    
-    # Security headers will be added via middleware
-    from starlette.middleware.base import BaseHTTPMiddleware
-    
-    class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request, call_next):
-            response = await call_next(request)
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["X-Frame-Options"] = "DENY"
-            response.headers["X-XSS-Protection"] = "1; mode=block"
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-            return response
-    
     app.add_middleware(SecurityHeadersMiddleware)
 
 
@@ -3,8 +3,11 @@ Service Discovery Module
 Service registration and discovery
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
 from enum import Enum
 from logger import logger
 
@@ -19,30 +22,37 @@ class ServiceStatus(str, Enum):
 class ServiceInstance:
     """Service instance"""
     
+    __slots__ = (
+        "name", "host", "port", "metadata", "status",
+        "last_heartbeat", "registered_at", "_url", "_static"
+    )
+    
     def __init__(self, name: str, host: str, port: int, metadata: Dict = None):
         self.name = name
         self.host = host
         self.port = port
         self.metadata = metadata or {}
         self.status = ServiceStatus.UP
-        self.last_heartbeat = datetime.now()
+        self.last_heartbeat = time.monotonic()
         self.registered_at = datetime.now()
+        self._url = f"http://{host}:{port}"
+        # Fields that never change after registration
+        self._static = {
+            "name": name,
+            "host": host,
+            "port": port,
+            "url": self._url,
+            "metadata": self.metadata,
+            "registered_at": self.registered_at.isoformat()
+        }
     
     def get_url(self) -> str:
         """Get service URL"""
-        return f"http://{self.host}:{self.port}"
+        return self._url
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {
-            "name": self.name,
-            "host": self.host,
-            "port": self.port,
-            "url": self.get_url(),
-            "status": self.status,
-            "metadata": self.metadata,
-            "registered_at": self.registered_at.isoformat()
-        }
+        return {**self._static, "status": self.status}
 
 
 class ServiceRegistry:
@@ -50,7 +60,14 @@ class ServiceRegistry:
     
     def __init__(self, heartbeat_timeout: int = 30):
         self.services: Dict[str, List[ServiceInstance]] = {}
+        # Direct lookup of instances by (name, host, port)
+        self._index: Dict[Tuple[str, str, int], ServiceInstance] = {}
         self.heartbeat_timeout = heartbeat_timeout
+        self._last_health_check = 0.0
+        self._health_check_interval = max(1, heartbeat_timeout // 4)
+        # Min-heap of (expiry, order, instance); one entry per live instance
+        self._expiry_heap: List[Tuple[float, int, ServiceInstance]] = []
+        self._expiry_order = itertools.count()
     
     def register(
         self,
@@ -62,10 +79,16 @@ class ServiceRegistry:
         """Register service instance"""
         instance = ServiceInstance(name, host, port, metadata)
         
-        if name not in self.services:
-            self.services[name] = []
+        instances = self.services.setdefault(name, [])
         
-        self.services[name].append(instance)
+        # Re-registering an address replaces the previous instance
+        previous = self._index.get((name, host, port))
+        if previous is not None:
+            instances.remove(previous)
+        
+        instances.append(instance)
+        self._index[(name, host, port)] = instance
+        self._schedule_expiry(instance)
         logger.info(f"Service registered: {name} at {instance.get_url()}")
         return instance
     
@@ -74,10 +97,9 @@ class ServiceRegistry:
         if name not in self.services:
             return False
         
-        self.services[name] = [
-            s for s in self.services[name]
-            if not (s.host == host and s.port == port)
-        ]
+        instance = self._index.pop((name, host, port), None)
+        if instance is not None:
+            self.services[name].remove(instance)
         
         logger.info(f"Service deregistered: {name} at {host}:{port}")
         return True
@@ -96,22 +118,42 @@ class ServiceRegistry:
     
     def heartbeat(self, name: str, host: str, port: int) -> bool:
         """Record heartbeat from service"""
-        if name in self.services:
-            for instance in self.services[name]:
-                if instance.host == host and instance.port == port:
-                    instance.last_heartbeat = datetime.now()
-                    return True
-        return False
+        instance = self._index.get((name, host, port))
+        if instance is None:
+            return False
+        instance.last_heartbeat = time.monotonic()
+        return True
+    
+    def _schedule_expiry(self, instance: ServiceInstance):
+        """Queue the instance to be checked when its heartbeat expires"""
+        heapq.heappush(
+            self._expiry_heap,
+            (
+                instance.last_heartbeat + self.heartbeat_timeout,
+                next(self._expiry_order),
+                instance
+            )
+        )
     
-    def check_health(self):
-        """Check health of all services"""
-        now = datetime.now()
-        timeout = timedelta(seconds=self.heartbeat_timeout)
+    def check_health(self, force: bool = False):
+        """Check health of all services (at most once per interval)"""
+        now = time.monotonic()
+        if not force and now - self._last_health_check < self._health_check_interval:
+            return
+        self._last_health_check = now
         
-        for service_instances in self.services.values():
-            for instance in service_instances:
-                if now - instance.last_heartbeat > timeout:
-                    instance.status = ServiceStatus.DOWN
+        # Only instances whose scheduled expiry has passed are examined
+        heap = self._expiry_heap
+        while heap and heap[0][0] < now:
+            _, _, instance = heapq.heappop(heap)
+            key = (instance.name, instance.host, instance.port)
+            if self._index.get(key) is not instance:
+                continue  # deregistered or replaced
+            if instance.last_heartbeat + self.heartbeat_timeout < now:
+                instance.status = ServiceStatus.DOWN
+            else:
+                # Heartbeat arrived since the entry was queued
+                self._schedule_expiry(instance)
     
     def get_services(self) -> Dict[str, List[Dict]]:
         """Get all registered services"""
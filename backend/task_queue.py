@@ -4,11 +4,17 @@ Background task processing
 """
 
 import asyncio
-from typing import Callable, Any, List, Dict
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from typing import Callable, Any, List, Dict, Optional
 from enum import Enum
 from datetime import datetime
 from logger import logger
 
+# Maximum number of queued tasks a worker drains per wakeup
+WORKER_BATCH_SIZE = 32
+
 
 class TaskStatus(str, Enum):
     """Task execution status"""
@@ -21,6 +27,11 @@ class TaskStatus(str, Enum):
 class Task:
     """Async task wrapper"""
     
+    __slots__ = (
+        "task_id", "func", "args", "kwargs", "status", "result",
+        "error", "created_at", "started_at", "completed_at"
+    )
+    
     def __init__(self, task_id: str, func: Callable, *args, **kwargs):
         self.task_id = task_id
         self.func = func
@@ -33,8 +44,8 @@ class Task:
         self.started_at = None
         self.completed_at = None
     
-    async def execute(self):
-        """Execute the task"""
+    async def execute(self, executor: Optional[Executor] = None):
+        """Execute the task, running sync functions in an executor"""
         try:
             self.status = TaskStatus.RUNNING
             self.started_at = datetime.now()
@@ -42,7 +53,11 @@ class Task:
             if asyncio.iscoroutinefunction(self.func):
                 self.result = await self.func(*self.args, **self.kwargs)
             else:
-                self.result = self.func(*self.args, **self.kwargs)
+                loop = asyncio.get_running_loop()
+                self.result = await loop.run_in_executor(
+                    executor,
+                    functools.partial(self.func, *self.args, **self.kwargs)
+                )
             
             self.status = TaskStatus.COMPLETED
             logger.info(f"Task {self.task_id} completed successfully")
@@ -57,41 +72,69 @@ class Task:
 class TaskQueue:
     """Async task queue for background processing"""
     
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, max_tasks: int = 10_000):
         self.max_workers = max_workers
-        self.tasks: Dict[str, Task] = {}
-        self.queue: asyncio.Queue = None
+        # Least recently used tasks are evicted once max_tasks is exceeded
+        self.max_tasks = max_tasks
+        self.tasks: "OrderedDict[str, Task]" = OrderedDict()
+        self._pending: "deque[Task]" = deque()
+        # Created in initialize() so it binds to the running loop
+        self._ready: Optional[asyncio.Event] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
     
     async def initialize(self):
         """Initialize the task queue"""
-        self.queue = asyncio.Queue()
+        self._ready = asyncio.Event()
+        if self._pending:
+            self._ready.set()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="task-queue"
+        )
         for _ in range(self.max_workers):
             asyncio.create_task(self._worker())
     
     async def _worker(self):
         """Worker coroutine processing tasks"""
         while True:
-            task = await self.queue.get()
-            try:
-                await task.execute()
-            finally:
-                self.queue.task_done()
+            while not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+            
+            batch = []
+            while self._pending and len(batch) < WORKER_BATCH_SIZE:
+                batch.append(self._pending.popleft())
+            await asyncio.gather(
+                *(task.execute(self._executor) for task in batch),
+                return_exceptions=True
+            )
     
     async def enqueue(self, task_id: str, func: Callable, *args, **kwargs) -> str:
         """Enqueue a task"""
         task = Task(task_id, func, *args, **kwargs)
         self.tasks[task_id] = task
-        await self.queue.put(task)
+        self.tasks.move_to_end(task_id)
+        while len(self.tasks) > self.max_tasks:
+            self.tasks.popitem(last=False)
+        self._pending.append(task)
+        if self._ready is not None:
+            self._ready.set()
         return task_id
     
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """Get task status and result"""
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             return {"error": "Task not found"}
         
-        task = self.tasks[task_id]
+        self.tasks.move_to_end(task_id)
+        return self._task_info(task)
+    
+    @staticmethod
+    def _task_info(task: Task) -> Dict[str, Any]:
+        """Build the status payload for a task"""
         return {
-            "task_id": task_id,
+            "task_id": task.task_id,
             "status": task.status,
             "result": task.result,
             "error": task.error,
@@ -101,7 +144,7 @@ class TaskQueue:
     
     def get_all_tasks(self) -> List[Dict[str, Any]]:
         """Get all tasks status"""
-        return [self.get_task_status(task_id) for task_id in self.tasks]
+        return [self._task_info(task) for task in self.tasks.values()]
 
 
 # Global task queue
@@ -4,10 +4,21 @@ Test the FastAPI endpoints
 """
 
 import requests
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000"
 
+# Shared session so every request reuses a keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
+
+def print_json(response):
+    """Pretty-print a JSON response body"""
+    print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
+
 
 def test_health():
     """Test health endpoint"""
@@ -15,9 +26,9 @@ def test_health():
     print("🏥 Testing Health Endpoint")
     print("=" * 80)
     
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
-    print(json.dumps(response.json(), indent=2))
+    print_json(response)
 
 
 def test_root():
@@ -26,9 +37,9 @@ def test_root():
     print("🏠 Testing Root Endpoint")
     print("=" * 80)
     
-    response = requests.get(f"{BASE_URL}/")
+    response = SESSION.get(f"{BASE_URL}/")
     print(f"Status: {response.status_code}")
-    print(json.dumps(response.json(), indent=2))
+    print_json(response)
 
 
 def test_images():
@@ -37,11 +48,16 @@ def test_images():
     print("🖼️  Testing Images Endpoint")
     print("=" * 80)
     
-    response = requests.get(f"{BASE_URL}/images/sound")
+    response = SESSION.get(f"{BASE_URL}/images/sound")
     print(f"Status: {response.status_code}")
-    data = response.json()
+    if response.status_code != 200:
+        print(response.text)
+        return
+    
+    data = orjson.loads(response.content)
     print(f"Total images: {data['count']}")
-    print(f"First image: {data['images'][0]['title']}")
+    if data['images']:
+        print(f"First image: {data['images'][0]['title']}")
 
 
 def test_chat():
@@ -56,16 +72,18 @@ def test_chat():
         "Explain compression and rarefaction"
     ]
     
-    for question in test_questions:
+    def ask(question):
+        return SESSION.post(f"{BASE_URL}/chat", json={"question": question})
+    
+    # Questions are independent, so send them concurrently
+    with ThreadPoolExecutor(max_workers=len(test_questions)) as executor:
+        responses = list(executor.map(ask, test_questions))
+    
+    for question, response in zip(test_questions, responses):
         print(f"\n📝 Question: {question}")
         
-        response = requests.post(
-            f"{BASE_URL}/chat",
-            json={"question": question}
-        )
-        
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Answer: {data['answer'][:200]}...")
             if data.get('image'):
                 print(f"🖼️  Image: {data['image']['filename']}")
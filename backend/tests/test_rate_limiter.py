@@ -0,0 +1,128 @@
+"""
+Rate Limiter Tests
+Unit tests for the token bucket rate limiter
+"""
+
+import sys
+sys.path.append('..')
+
+import rate_limiter
+from rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+
+
+def _with_fake_clock(test):
+    """Run a test with rate_limiter's clock replaced by a FakeClock"""
+    def wrapper():
+        clock = FakeClock()
+        real_time = rate_limiter.time
+        rate_limiter.time = clock
+        try:
+            test(clock)
+        finally:
+            rate_limiter.time = real_time
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_fake_clock
+def test_burst_up_to_capacity(clock):
+    """Test a full bucket allows a burst of requests_per_minute calls"""
+    limiter = RateLimiter(requests_per_minute=60)
+    
+    for i in range(60):
+        allowed, info = limiter.is_allowed("client")
+        assert allowed
+        assert info["remaining"] == 59 - i
+    
+    allowed, info = limiter.is_allowed("client")
+    assert not allowed
+    assert info["remaining"] == 0
+    # One token refills per second at 60 requests/minute
+    assert info["reset_in_seconds"] == 1
+    
+    print("✅ Burst test passed")
+
+
+@_with_fake_clock
+def test_refill_over_time(clock):
+    """Test tokens refill at requests_per_minute / 60 per second"""
+    limiter = RateLimiter(requests_per_minute=60)
+    for _ in range(60):
+        limiter.is_allowed("client")
+    assert not limiter.is_allowed("client")[0]
+    
+    clock.now += 2.5
+    allowed, info = limiter.is_allowed("client")
+    assert allowed
+    assert info["remaining"] == 1
+    # 58.5 tokens missing at one token per second
+    assert info["reset_in_seconds"] == 58
+    
+    assert limiter.is_allowed("client")[0]
+    allowed, info = limiter.is_allowed("client")
+    assert not allowed
+    # Half a token missing still means waiting into the next second
+    assert info["reset_in_seconds"] == 1
+    
+    # Refill never exceeds capacity
+    clock.now += 3600
+    allowed, info = limiter.is_allowed("client")
+    assert allowed
+    assert info["remaining"] == 59
+    
+    print("✅ Refill test passed")
+
+
+@_with_fake_clock
+def test_reset_in_seconds_scales_with_rate(clock):
+    """Test the wait reported when denied follows the refill rate"""
+    limiter = RateLimiter(requests_per_minute=6)
+    for _ in range(6):
+        assert limiter.is_allowed("client")[0]
+    
+    allowed, info = limiter.is_allowed("client")
+    assert not allowed
+    # One token every 10 seconds
+    assert info["reset_in_seconds"] == 10
+    
+    clock.now += 4
+    allowed, info = limiter.is_allowed("client")
+    assert not allowed
+    assert info["reset_in_seconds"] == 6
+    
+    print("✅ Reset time test passed")
+
+
+@_with_fake_clock
+def test_clients_and_users_are_independent(clock):
+    """Test buckets are tracked per client and per user"""
+    limiter = RateLimiter(requests_per_minute=1)
+    
+    assert limiter.is_allowed("client_a")[0]
+    assert not limiter.is_allowed("client_a")[0]
+    assert limiter.is_allowed("client_b")[0]
+    
+    allowed, info = limiter.is_allowed("client_a", user_id="user_1")
+    assert allowed
+    assert info["user_id"] == "user_1"
+    
+    print("✅ Independent buckets test passed")
+
+
+if __name__ == "__main__":
+    test_burst_up_to_capacity()
+    test_refill_over_time()
+    test_reset_in_seconds_scales_with_rate()
+    test_clients_and_users_are_independent()
+    print("\n🎉 Rate limiter tests completed!")
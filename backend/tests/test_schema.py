@@ -0,0 +1,68 @@
+"""
+Schema Tests
+Unit tests for the slotted dataclass models
+"""
+
+import sys
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+sys.path.append('..')
+
+from schema import TextChunk, ImageData, ChatMessage, PDFMetadata
+
+
+def _sample_models():
+    """One instance of every schema model"""
+    return [
+        TextChunk("chunk_1", "sound.pdf", 3, "Sound travels as a wave", "emb_1"),
+        ImageData("img_1", "sound.pdf", 4, "images/bell.png", "A ringing bell", "emb_2"),
+        ChatMessage(
+            "msg_1", datetime(2024, 1, 1, 12, 0), "What is sound?", "A wave",
+            ["chunk_1"], ["img_1"], "test-model"
+        ),
+        PDFMetadata("sound.pdf", datetime(2024, 1, 1), 2048, 10, 42, "completed"),
+    ]
+
+
+def test_pickle_round_trip():
+    """Test every model survives pickling"""
+    for model in _sample_models():
+        assert pickle.loads(pickle.dumps(model)) == model
+    
+    print("✅ Pickle round trip test passed")
+
+
+def test_copy_round_trip():
+    """Test every model can be shallow and deep copied"""
+    for model in _sample_models():
+        assert copy.copy(model) == model
+        assert copy.deepcopy(model) == model
+    
+    print("✅ Copy round trip test passed")
+
+
+def test_frozen_models_reject_mutation():
+    """Test frozen models still raise on assignment"""
+    for model in _sample_models()[:3]:
+        try:
+            first_field = type(model).__slots__[0]
+            setattr(model, first_field, "changed")
+            assert False, f"{type(model).__name__} should be frozen"
+        except FrozenInstanceError:
+            pass
+    
+    # PDFMetadata stays mutable for status updates
+    metadata = _sample_models()[3]
+    metadata.status = "failed"
+    assert metadata.status == "failed"
+    
+    print("✅ Frozen model test passed")
+
+
+if __name__ == "__main__":
+    test_pickle_round_trip()
+    test_copy_round_trip()
+    test_frozen_models_reject_mutation()
+    print("\n🎉 Schema tests completed!")
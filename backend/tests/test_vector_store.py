@@ -0,0 +1,137 @@
+"""
+Vector Store Tests
+Unit tests for building, searching and persisting FAISS indices
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append('..')
+
+import numpy as np
+
+from vector_store import VectorStore, CHUNK_TABLE_FILE, MIN_IVF_VECTORS, MIN_IVFPQ_VECTORS
+
+EMBEDDING_DIM = 64
+
+# (index_type, quantize, corpus size); IVF variants need enough vectors to train
+INDEX_CONFIGS = [
+    ("flat", None, 200),
+    ("flat", "sq8", 200),
+    ("hnsw", None, 500),
+    ("ivf", None, MIN_IVF_VECTORS),
+    ("ivfpq", None, MIN_IVFPQ_VECTORS),
+]
+
+
+def _make_corpus(n: int, seed: int = 0):
+    """Random embeddings with matching chunk ids, texts and indices"""
+    rng = np.random.default_rng(seed)
+    embeddings = rng.standard_normal((n, EMBEDDING_DIM)).astype(np.float32)
+    chunk_ids = [f"chunk_{i}" for i in range(n)]
+    texts = [f"text {i}" for i in range(n)]
+    return embeddings, chunk_ids, texts, list(range(n))
+
+
+def _build(index_type: str, quantize, n: int):
+    """Build a text index over a random corpus"""
+    embeddings, chunk_ids, texts, chunk_indices = _make_corpus(n)
+    store = VectorStore(embedding_dim=EMBEDDING_DIM, index_type=index_type, quantize=quantize)
+    store.create_text_index_from_columns(embeddings, chunk_ids, texts, chunk_indices)
+    return store, embeddings
+
+
+def test_search_finds_query_chunk():
+    """Test every index type returns the query's own chunk first"""
+    for index_type, quantize, n in INDEX_CONFIGS:
+        store, embeddings = _build(index_type, quantize, n)
+        
+        results = store.search_text(embeddings[7], k=5)
+        assert len(results) == 5, index_type
+        assert results[0]['chunk_id'] == "chunk_7", (index_type, quantize)
+        assert results[0]['text'] == "text 7"
+        assert [r['rank'] for r in results] == [1, 2, 3, 4, 5]
+        scores = [r['similarity_score'] for r in results]
+        assert scores == sorted(scores, reverse=True), index_type
+    
+    print("✅ Search test passed")
+
+
+def test_search_text_batch_matches_single_queries():
+    """Test batched search returns the same hits as one query at a time"""
+    for index_type, quantize, n in INDEX_CONFIGS:
+        store, embeddings = _build(index_type, quantize, n)
+        
+        batch = store.search_text_batch(embeddings[:4], k=3)
+        assert len(batch) == 4
+        for query, batch_results in zip(embeddings[:4], batch):
+            single = store.search_text(query, k=3)
+            assert [r['chunk_id'] for r in batch_results] == [r['chunk_id'] for r in single]
+    
+    print("✅ Batch search test passed")
+
+
+def test_search_does_not_modify_query():
+    """Test normalizing queries leaves the caller's array untouched"""
+    store, embeddings = _build("flat", None, 50)
+    query = embeddings[3].copy()
+    
+    store.search_text(query, k=1)
+    store.search_text_batch(query.reshape(1, -1), k=1)
+    assert np.array_equal(query, embeddings[3])
+    
+    print("✅ Query immutability test passed")
+
+
+def test_save_and_reload():
+    """Test indices and chunk columns survive a save/load round trip"""
+    for index_type, quantize, n in INDEX_CONFIGS:
+        store, embeddings = _build(index_type, quantize, n)
+        expected = store.search_text_batch(embeddings[:3], k=3)
+        
+        with tempfile.TemporaryDirectory() as save_dir:
+            store.save_indices(save_dir)
+            
+            reloaded = VectorStore(embedding_dim=EMBEDDING_DIM)
+            reloaded.load_indices(save_dir)
+            assert reloaded.text_index.ntotal == n
+            assert type(reloaded.text_index) is type(store.text_index), index_type
+            
+            results = reloaded.search_text_batch(embeddings[:3], k=3)
+            for before, after in zip(expected, results):
+                assert [r['chunk_id'] for r in after] == [r['chunk_id'] for r in before]
+                assert [r['text'] for r in after] == [r['text'] for r in before]
+            # Release the memory-mapped index before the directory is removed
+            del reloaded
+    
+    print("✅ Save and reload test passed")
+
+
+def test_json_mapping_round_trip():
+    """Test the JSON chunk mapping loads when no columnar table is present"""
+    store, embeddings = _build("flat", None, 50)
+    
+    with tempfile.TemporaryDirectory() as save_dir:
+        store.save_indices(save_dir, write_json=True)
+        
+        table_path = os.path.join(save_dir, CHUNK_TABLE_FILE)
+        if os.path.exists(table_path):
+            os.remove(table_path)
+        
+        reloaded = VectorStore(embedding_dim=EMBEDDING_DIM)
+        reloaded.load_indices(save_dir)
+        results = reloaded.search_text(embeddings[5], k=1)
+        assert results[0]['chunk_id'] == "chunk_5"
+        assert results[0]['text'] == "text 5"
+        del reloaded
+    
+    print("✅ JSON mapping test passed")
+
+
+if __name__ == "__main__":
+    test_search_finds_query_chunk()
+    test_search_text_batch_matches_single_queries()
+    test_search_does_not_modify_query()
+    test_save_and_reload()
+    test_json_mapping_round_trip()
+    print("\n🎉 Vector store tests completed!")
@@ -0,0 +1,110 @@
+"""
+Webhook Manager Tests
+Unit tests for webhook delivery and signatures
+"""
+
+import sys
+import asyncio
+sys.path.append('..')
+
+import webhook_manager
+from webhook_manager import WebhookManager, WebhookEvent
+
+
+def test_trigger_and_flush_delivers():
+    """Test queued events reach sync and async subscribers in order"""
+    async def run():
+        manager = WebhookManager()
+        received = []
+        
+        async def async_callback(event):
+            await asyncio.sleep(0)
+            received.append(("async", event.data["n"]))
+        
+        def sync_callback(event):
+            received.append(("sync", event.data["n"]))
+        
+        manager.subscribe("pdf.uploaded", async_callback)
+        manager.subscribe("pdf.uploaded", sync_callback)
+        
+        for n in range(3):
+            await manager.trigger(WebhookEvent("pdf.uploaded", {"n": n}))
+        await manager.trigger(WebhookEvent("other", {"n": 99}))
+        await manager.flush()
+        
+        assert [n for kind, n in received if kind == "async"] == [0, 1, 2]
+        assert [n for kind, n in received if kind == "sync"] == [0, 1, 2]
+        assert len(manager.get_history()) == 4
+        assert len(manager.get_history(event_type="other")) == 1
+        assert manager.dropped_events == 0
+    
+    asyncio.run(run())
+    print("✅ Trigger and flush test passed")
+
+
+def test_failing_callback_does_not_block_others():
+    """Test one subscriber raising doesn't stop delivery to the rest"""
+    async def run():
+        manager = WebhookManager()
+        received = []
+        
+        def failing_callback(event):
+            raise RuntimeError("subscriber failed")
+        
+        manager.subscribe("chat.answered", failing_callback)
+        manager.subscribe("chat.answered", lambda event: received.append(event.event_type))
+        
+        await manager.trigger(WebhookEvent("chat.answered", {}))
+        await manager.flush()
+        
+        assert received == ["chat.answered"]
+    
+    asyncio.run(run())
+    print("✅ Failing callback test passed")
+
+
+def test_queue_full_drops_events():
+    """Test events beyond the queue capacity are dropped and counted"""
+    async def run():
+        manager = WebhookManager()
+        received = []
+        manager.subscribe("bulk", lambda event: received.append(event.data["n"]))
+        
+        # The worker can't run between these triggers, so the queue fills up
+        for n in range(5):
+            await manager.trigger(WebhookEvent("bulk", {"n": n}))
+        await manager.flush()
+        
+        assert received == [0, 1]
+        assert manager.dropped_events == 3
+        assert len(manager.get_history()) == 2
+    
+    queue_size = webhook_manager.DELIVERY_QUEUE_SIZE
+    webhook_manager.DELIVERY_QUEUE_SIZE = 2
+    try:
+        asyncio.run(run())
+    finally:
+        webhook_manager.DELIVERY_QUEUE_SIZE = queue_size
+    print("✅ Queue full test passed")
+
+
+def test_signature_accepts_bytes_and_str():
+    """Test signatures match for bytes and str payloads"""
+    manager = WebhookManager(secret_key="test-secret")
+    payload = '{"event": "pdf.uploaded"}'
+    
+    signature = manager.generate_signature(payload.encode())
+    assert signature == manager.generate_signature(payload)
+    assert manager.verify_signature(payload.encode(), signature)
+    assert manager.verify_signature(payload, signature)
+    assert not manager.verify_signature(b"tampered", signature)
+    
+    print("✅ Signature test passed")
+
+
+if __name__ == "__main__":
+    test_trigger_and_flush_delivers()
+    test_failing_callback_does_not_block_others()
+    test_queue_full_drops_events()
+    test_signature_accepts_bytes_and_str()
+    print("\n🎉 Webhook manager tests completed!")
@@ -3,13 +3,26 @@ Utility Functions
 Helper functions for the application
 """
 
+import re
+import time
 from datetime import datetime
 from typing import Dict, Any
 
+_UNSAFE_FILENAME_CHARS = frozenset('<>:"/\\|?*')
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# (second, formatted) of the last timestamp produced
+_timestamp_cache = [0, ""]
+
 
 def format_timestamp() -> str:
-    """Get formatted timestamp"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    """Get formatted timestamp (formatted at most once per second)"""
+    second = int(time.time())
+    if _timestamp_cache[0] != second:
+        _timestamp_cache[1] = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        _timestamp_cache[0] = second
+    return _timestamp_cache[1]
 
 
 def sanitize_filename(filename: str) -> str:
@@ -22,9 +35,12 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    import re
+    # Already safe names skip the regex pass
+    if _UNSAFE_FILENAME_CHARS.isdisjoint(filename):
+        return filename[:255]
+    
     # Remove path separators and dangerous chars
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = _UNSAFE_FILENAME_RE.sub('', filename)
     return filename[:255]  # Limit length
 
 
@@ -38,11 +54,11 @@ def format_file_size(bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes < 1024.0:
-            return f"{bytes:.1f} {unit}"
-        bytes /= 1024.0
-    return f"{bytes:.1f} TB"
+    if bytes < 1024:
+        return f"{bytes:.1f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it
+    idx = min((int(bytes).bit_length() - 1) // 10, 4)
+    return f"{bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def create_response(
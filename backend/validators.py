@@ -3,9 +3,14 @@ Input Validation Module
 Validates user inputs and file uploads
 """
 
+from functools import lru_cache
 from typing import Tuple
 import re
 
+# Compiled once at import time
+_TOPIC_RE = re.compile(r'^[a-z0-9_]+$')
+_DANGEROUS_CHARS = frozenset('<>:"/\\|?*')
+
 
 def validate_pdf_filename(filename: str) -> Tuple[bool, str]:
     """
@@ -24,8 +29,7 @@ def validate_pdf_filename(filename: str) -> Tuple[bool, str]:
         return False, "Only PDF files are allowed"
     
     # Check for dangerous characters
-    dangerous_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-    if any(char in filename for char in dangerous_chars):
+    if not _DANGEROUS_CHARS.isdisjoint(filename):
         return False, "Filename contains invalid characters"
     
     if len(filename) > 255:
@@ -44,13 +48,18 @@ def validate_question(question: str) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not question or not question.strip():
+    if not question:
         return False, "Question cannot be empty"
     
-    if len(question) > 1000:
+    # Length bounds first so oversized input is rejected before strip() copies it
+    length = len(question)
+    if length > 1000:
         return False, "Question too long (max 1000 characters)"
     
-    if len(question) < 3:
+    if not question.strip():
+        return False, "Question cannot be empty"
+    
+    if length < 3:
         return False, "Question too short (min 3 characters)"
     
     return True, ""
@@ -69,13 +78,19 @@ def validate_topic_id(topic_id: str) -> Tuple[bool, str]:
     if not topic_id:
         return False, "Topic ID cannot be empty"
     
-    # Only allow alphanumeric and underscores
-    if not re.match(r'^[a-z0-9_]+$', topic_id):
-        return False, "Invalid topic ID format"
-    
     if len(topic_id) > 100:
         return False, "Topic ID too long"
     
+    return _check_topic_format(topic_id)
+
+
+@lru_cache(maxsize=1024)
+def _check_topic_format(topic_id: str) -> Tuple[bool, str]:
+    """Check topic ID characters (cached, inputs are bounded to 100 chars)"""
+    # Only allow alphanumeric and underscores
+    if not _TOPIC_RE.match(topic_id):
+        return False, "Invalid topic ID format"
+    
     return True, ""
 
 
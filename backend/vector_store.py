@@ -3,29 +3,190 @@ Vector Store Module
 Handles FAISS indexing and similarity search
 """
 
-import faiss
-import numpy as np
-import json
 import os
-from typing import List, Dict, Tuple
-from embedding_generator import EmbeddingGenerator
+import threading
+
+# Idle OpenMP threads should sleep rather than spin, otherwise they starve
+# BLAS and the web workers. Must be set before the OpenMP runtime starts.
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")
+
+import faiss  # noqa: E402
+import numpy as np  # noqa: E402
+import json  # noqa: E402
+from contextlib import contextmanager  # noqa: E402
+from typing import List, Dict, Tuple, Optional  # noqa: E402
+from embedding_generator import EmbeddingGenerator, l2_normalize  # noqa: E402
+
+try:
+    # Columnar chunk storage; JSON is used when pyarrow is unavailable
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+
+CHUNK_TABLE_FILE = "chunk_table.feather"
+CHUNK_MAPPING_FILE = "chunk_mapping.json"
+
+INDEX_TYPES = ("flat", "ivf", "ivfpq", "hnsw")
+DEFAULT_NPROBE = 16
+# HNSW graph degree, build-time and default query-time beam widths
+HNSW_M = 32
+HNSW_EF_CONSTRUCTION = 200
+DEFAULT_EF_SEARCH = 64
+PQ_BITS = 8
+# k-means needs ~39 points per centroid; smaller sets stay flat
+MIN_IVF_VECTORS = 4096
+MIN_IVFPQ_VECTORS = 39 * (1 << PQ_BITS)
+# Optional scalar quantization of stored vectors (4x / 2x smaller than float32)
+SCALAR_QUANTIZERS = {
+    "sq8": faiss.ScalarQuantizer.QT_8bit,
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+}
+
+
+def _pq_subquantizers(dim: int) -> int:
+    """Pick the number of PQ sub-quantizers (must divide dim)"""
+    for m in (48, 32, 24, 16, 12, 8, 4, 2):
+        if dim % m == 0:
+            return m
+    return 1
+
+
+@contextmanager
+def _omp_threads(num_threads: int):
+    """Temporarily change the FAISS OpenMP thread count for this thread"""
+    previous = faiss.omp_get_max_threads()
+    faiss.omp_set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        faiss.omp_set_num_threads(previous)
+
+
+def _read_index(path: str) -> "faiss.Index":
+    """Memory-map an index file, falling back to a full read"""
+    try:
+        # Vectors and inverted lists stay in the page cache, shared across processes
+        return faiss.read_index(path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except RuntimeError:
+        # Older FAISS builds cannot map every index type
+        return faiss.read_index(path)
+
+
+def _write_index(index, path: str, on_gpu: bool = False) -> None:
+    """Write an index atomically so mapped readers never see a partial file"""
+    if on_gpu:
+        # GPU indices (including multi-GPU replicas/shards) must be copied
+        # back to host memory to be serialized
+        index = faiss.index_gpu_to_cpu(index)
+    tmp_path = f"{path}.tmp"
+    faiss.write_index(index, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _object_column(values: List) -> np.ndarray:
+    """Build a 1-D object array (never nested, whatever the values are)"""
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
 
 
 class VectorStore:
     """Manage FAISS vector indices for text and images"""
     
-    def __init__(self, embedding_dim: int = 384):
+    def __init__(self, embedding_dim: int = 384, index_type: str = "flat",
+                 nprobe: int = DEFAULT_NPROBE, quantize: Optional[str] = None,
+                 num_threads: Optional[int] = None, ef_search: int = DEFAULT_EF_SEARCH):
         """
         Initialize vector store
         
         Args:
             embedding_dim: Dimension of embedding vectors
+            index_type: "flat" (exact), "ivf", "ivfpq" or "hnsw" (approximate)
+            nprobe: Number of IVF lists visited per query
+            quantize: Store vectors as "sq8" or "fp16" (not with ivfpq)
+            num_threads: OpenMP threads for index builds and batched searches
+            ef_search: HNSW candidate list size per query
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type: {index_type}")
+        if quantize is not None and quantize not in SCALAR_QUANTIZERS:
+            raise ValueError(f"Unknown quantizer: {quantize}")
+        if quantize is not None and index_type == "ivfpq":
+            raise ValueError("ivfpq already compresses vectors; quantize is not supported")
+        
         self.embedding_dim = embedding_dim
+        self.index_type = index_type
+        self.quantize = quantize
+        faiss.omp_set_num_threads(num_threads or os.cpu_count() or 1)
+        self.nprobe = nprobe
+        self.ef_search = ef_search
         self.text_index = None
         self.image_index = None
-        self.chunk_mapping = {}
+        # Chunk data as columns indexed by FAISS position
+        self.chunk_ids = _object_column([])
+        self.chunk_texts = _object_column([])
+        self.chunk_indices = np.empty(0, dtype=np.int32)
         self.image_mapping = {}
+        # Set by to_gpu(); GPU resources are kept alive while the index is there
+        self._text_on_gpu = False
+        self._gpu_resources = None
+        # Per-thread (1, dim) float32 buffer reused by single-query searches
+        self._local = threading.local()
+    
+    def _build_index(self, vectors: np.ndarray) -> "faiss.Index":
+        """
+        Build and fill an index of the configured type
+        
+        Args:
+            vectors: Normalized float32 vectors of shape (n, dim)
+            
+        Returns:
+            Populated FAISS index
+        """
+        n, d = vectors.shape
+        min_vectors = MIN_IVFPQ_VECTORS if self.index_type == "ivfpq" else MIN_IVF_VECTORS
+        qtype = SCALAR_QUANTIZERS.get(self.quantize)
+        
+        if self.index_type == "hnsw":
+            # Graph index: no training, exact vectors (unless quantized)
+            if qtype is None:
+                index = faiss.IndexHNSWFlat(d, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            else:
+                index = faiss.IndexHNSWSQ(d, qtype, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        elif self.index_type == "flat" or n < min_vectors:
+            if qtype is None:
+                index = faiss.IndexFlatIP(d)
+            else:
+                index = faiss.IndexScalarQuantizer(d, qtype, faiss.METRIC_INNER_PRODUCT)
+        else:
+            # Roughly 4*sqrt(n) lists, keeping ~39 training points per list
+            nlist = max(1, min(int(4 * np.sqrt(n)), n // 39))
+            quantizer = faiss.IndexFlatIP(d)
+            if self.index_type == "ivfpq":
+                index = faiss.IndexIVFPQ(quantizer, d, nlist, _pq_subquantizers(d),
+                                         PQ_BITS, faiss.METRIC_INNER_PRODUCT)
+            elif qtype is not None:
+                index = faiss.IndexIVFScalarQuantizer(quantizer, d, nlist, qtype,
+                                                      faiss.METRIC_INNER_PRODUCT)
+            else:
+                index = faiss.IndexIVFFlat(quantizer, d, nlist, faiss.METRIC_INNER_PRODUCT)
+        
+        if not index.is_trained:
+            index.train(vectors)
+        index.add(vectors)
+        self._apply_search_params(index)
+        return index
+    
+    def _apply_search_params(self, index) -> None:
+        """Set default nprobe (IVF) or efSearch (HNSW); no-op for flat indices"""
+        if index is None:
+            return
+        if hasattr(index, "nprobe"):
+            index.nprobe = self.nprobe
+        elif hasattr(index, "hnsw"):
+            index.hnsw.efSearch = self.ef_search
     
     def create_text_index(self, embeddings: np.ndarray, chunk_ids: List[str], 
                           chunks: List[Dict]) -> None:
@@ -37,27 +198,44 @@ class VectorStore:
             chunk_ids: List of chunk IDs
             chunks: List of chunk data dictionaries
         """
-        print(f"\n🗄️  Creating FAISS index for text...")
+        self.create_text_index_from_columns(
+            embeddings,
+            chunk_ids,
+            [chunk['text'] for chunk in chunks],
+            [chunk['chunk_index'] for chunk in chunks]
+        )
+    
+    def create_text_index_from_columns(self, embeddings: np.ndarray, chunk_ids: List[str],
+                                       texts: List[str], chunk_indices: List[int]) -> None:
+        """
+        Create FAISS index for text chunks given as parallel columns
         
-        # Create FAISS index (L2 distance)
-        self.text_index = faiss.IndexFlatL2(self.embedding_dim)
+        Args:
+            embeddings: Array of embedding vectors
+            chunk_ids: List of chunk IDs
+            texts: Chunk texts, aligned with chunk_ids
+            chunk_indices: Chunk positions, aligned with chunk_ids
+        """
+        print(f"\n🗄️  Creating FAISS index for text...")
         
-        # Add vectors to index
-        self.text_index.add(embeddings.astype('float32'))
+        # Inner product over normalized vectors is cosine similarity
+        self.text_index = self._build_index(l2_normalize(embeddings))
+        self._text_on_gpu = False
+        self._gpu_resources = None
         
-        # Create mapping from index position to chunk data
-        self.chunk_mapping = {
-            i: {
-                'chunk_id': chunk_ids[i],
-                'text': chunks[i]['text'],
-                'chunk_index': chunks[i]['chunk_index']
-            }
-            for i in range(len(chunk_ids))
-        }
+        # Columns aligned with index positions
+        self._set_chunk_columns(chunk_ids, texts, chunk_indices)
         
         print(f"✅ Text index created!")
         print(f"   Vectors in index: {self.text_index.ntotal}")
-        print(f"   Index type: IndexFlatL2 (100% accurate)")
+        print(f"   Index type: {type(self.text_index).__name__}")
+    
+    def _set_chunk_columns(self, chunk_ids: List[str], texts: List[str],
+                           chunk_indices: List[int]) -> None:
+        """Store chunk data as columns aligned with text index positions"""
+        self.chunk_ids = _object_column(chunk_ids)
+        self.chunk_texts = _object_column(texts)
+        self.chunk_indices = np.fromiter(chunk_indices, dtype=np.int32, count=len(chunk_indices))
     
     def create_image_index(self, embeddings: np.ndarray, image_ids: List[str],
                           images: List[Dict]) -> None:
@@ -71,11 +249,8 @@ class VectorStore:
         """
         print(f"\n🗄️  Creating FAISS index for images...")
         
-        # Create FAISS index
-        self.image_index = faiss.IndexFlatL2(self.embedding_dim)
-        
-        # Add vectors to index
-        self.image_index.add(embeddings.astype('float32'))
+        # Inner product over normalized vectors is cosine similarity
+        self.image_index = self._build_index(l2_normalize(embeddings))
         
         # Create mapping
         self.image_mapping = {
@@ -92,39 +267,77 @@ class VectorStore:
         print(f"✅ Image index created!")
         print(f"   Vectors in index: {self.image_index.ntotal}")
     
-    def search_text(self, query_embedding: np.ndarray, k: int = 5) -> List[Dict]:
+    def search_text(self, query_embedding: np.ndarray, k: int = 5,
+                    nprobe: Optional[int] = None,
+                    ef_search: Optional[int] = None) -> List[Dict]:
         """
         Search for similar text chunks
         
         Args:
             query_embedding: Query vector
             k: Number of results to return
+            nprobe: Override the number of IVF lists visited (IVF indices only)
+            ef_search: Override the HNSW candidate list size (HNSW indices only)
             
         Returns:
             List of matching chunks with scores
         """
-        if self.text_index is None:
-            raise ValueError("Text index not initialized!")
-        
         # Reshape for FAISS (needs 2D array)
-        query_vector = query_embedding.reshape(1, -1).astype('float32')
+        return self.search_text_batch(
+            query_embedding.reshape(1, -1), k, nprobe, ef_search
+        )[0]
+    
+    def search_text_batch(self, query_embeddings: np.ndarray, k: int = 5,
+                          nprobe: Optional[int] = None,
+                          ef_search: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Search for similar text chunks for many queries in one FAISS call
         
-        # Search
-        distances, indices = self.text_index.search(query_vector, k)
+        Args:
+            query_embeddings: Query vectors of shape (nq, dim)
+            k: Number of results to return per query
+            nprobe: Override the number of IVF lists visited (IVF indices only)
+            ef_search: Override the HNSW candidate list size (HNSW indices only)
+            
+        Returns:
+            One list of matching chunks with scores per query
+        """
+        if self.text_index is None:
+            raise ValueError("Text index not initialized!")
+        if query_embeddings.ndim != 2:
+            raise ValueError("query_embeddings must be a 2D array (nq, dim)")
+        
+        # A single (nq, dim) search lets FAISS use GEMM and spread queries over threads
+        query_vectors = self._prepare_queries(query_embeddings)
+        scores, indices = self._search(
+            self.text_index, query_vectors, k, nprobe, ef_search, on_gpu=self._text_on_gpu
+        )
+        
+        if len(self.chunk_ids) == 0:
+            return [[] for _ in range(len(query_vectors))]
+        
+        # Gather every hit in one go; missing results are padded with -1 at
+        # the end of a row, so each row keeps its first `count` entries
+        found = indices >= 0
+        counts = found.sum(axis=1).tolist()
+        positions = np.where(found, indices, 0)
+        id_rows = self.chunk_ids[positions].tolist()
+        text_rows = self.chunk_texts[positions].tolist()
+        score_rows = scores.tolist()
         
         # Format results
-        results = []
-        for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
-            chunk_data = self.chunk_mapping[idx]
-            results.append({
-                'rank': i + 1,
-                'chunk_id': chunk_data['chunk_id'],
-                'text': chunk_data['text'],
-                'distance': float(distance),
-                'similarity_score': self._distance_to_similarity(distance)
-            })
-        
-        return results
+        return [
+            [
+                {
+                    'rank': r + 1,
+                    'chunk_id': id_row[r],
+                    'text': text_row[r],
+                    'similarity_score': score_row[r]
+                }
+                for r in range(count)
+            ]
+            for id_row, text_row, score_row, count in zip(id_rows, text_rows, score_rows, counts)
+        ]
     
     def search_images(self, query_embedding: np.ndarray, k: int = 1) -> List[Dict]:
         """
@@ -141,14 +354,16 @@ class VectorStore:
             raise ValueError("Image index not initialized!")
         
         # Reshape for FAISS
-        query_vector = query_embedding.reshape(1, -1).astype('float32')
+        query_vector = self._prepare_queries(query_embedding.reshape(1, -1))
         
         # Search
-        distances, indices = self.image_index.search(query_vector, k)
+        scores, indices = self._search(self.image_index, query_vector, k)
         
         # Format results
         results = []
-        for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
+        for i, (score, idx) in enumerate(zip(scores[0], indices[0])):
+            if idx < 0:
+                break
             image_data = self.image_mapping[idx]
             results.append({
                 'rank': i + 1,
@@ -157,28 +372,95 @@ class VectorStore:
                 'title': image_data['title'],
                 'description': image_data['description'],
                 'keywords': image_data['keywords'],
-                'distance': float(distance),
-                'similarity_score': self._distance_to_similarity(distance)
+                'similarity_score': float(score)
             })
         
         return results
     
-    def _distance_to_similarity(self, distance: float) -> float:
+    def _prepare_queries(self, query_embeddings: np.ndarray) -> np.ndarray:
+        """
+        Copy queries into a contiguous float32 buffer and normalize it in
+        place, leaving the caller's array untouched
+        
+        Args:
+            query_embeddings: Query vectors of shape (nq, dim)
+            
+        Returns:
+            Normalized float32 array of shape (nq, dim)
+        """
+        if len(query_embeddings) == 1:
+            # Single queries (the per-request path) reuse a per-thread buffer
+            buffer = getattr(self._local, "query", None)
+            if buffer is None or buffer.shape != query_embeddings.shape:
+                buffer = np.empty(query_embeddings.shape, dtype=np.float32)
+                self._local.query = buffer
+        else:
+            buffer = np.empty(query_embeddings.shape, dtype=np.float32)
+        
+        np.copyto(buffer, query_embeddings, casting='same_kind')
+        return l2_normalize(buffer)
+    
+    @staticmethod
+    def _search(index, query_vectors: np.ndarray, k: int,
+                nprobe: Optional[int] = None,
+                ef_search: Optional[int] = None,
+                on_gpu: bool = False) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Convert L2 distance to similarity score (0-1)
-        Lower distance = Higher similarity
+        Run an index search, passing nprobe (IVF) or efSearch (HNSW) per call
+        
+        Returns:
+            Tuple of (cosine similarities, indices)
         """
-        # Simple conversion: inverse with normalization
-        # This gives scores roughly between 0-1
-        similarity = 1 / (1 + distance)
-        return similarity
+        params = None
+        if nprobe is not None and hasattr(index, "nprobe"):
+            params = faiss.SearchParametersIVF(nprobe=nprobe)
+        elif ef_search is not None and hasattr(index, "hnsw"):
+            params = faiss.SearchParametersHNSW(efSearch=ef_search)
+        
+        if len(query_vectors) == 1 and not on_gpu:
+            # FAISS parallelizes across queries; for one query the thread
+            # fan-out only adds synchronization latency
+            with _omp_threads(1):
+                scores, indices = index.search(query_vectors, k, params=params)
+        else:
+            scores, indices = index.search(query_vectors, k, params=params)
+        
+        if index.metric_type == faiss.METRIC_L2:
+            # Indices saved before the switch to inner product return squared
+            # L2 distances, which for unit vectors equal 2 - 2*cos
+            scores = 1.0 - scores / 2.0
+        return scores, indices
     
-    def save_indices(self, save_dir: str) -> None:
+    def to_gpu(self, device: int = 0, all_gpus: bool = False) -> None:
+        """
+        Move the text index to GPU for batched search and re-indexing jobs
+        (single queries are faster on CPU because of kernel launch overhead)
+        
+        Args:
+            device: GPU ordinal to use
+            all_gpus: Shard/replicate the index over every visible GPU instead
+        """
+        if self.text_index is None:
+            raise ValueError("Text index not initialized!")
+        if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+            raise RuntimeError("FAISS GPU support is not available (install faiss-gpu)")
+        
+        if all_gpus:
+            self.text_index = faiss.index_cpu_to_all_gpus(self.text_index)
+        else:
+            self._gpu_resources = faiss.StandardGpuResources()
+            self.text_index = faiss.index_cpu_to_gpu(self._gpu_resources, device, self.text_index)
+        self._text_on_gpu = True
+        
+        print(f"✅ Text index moved to GPU ({faiss.get_num_gpus()} visible)")
+    
+    def save_indices(self, save_dir: str, write_json: bool = False) -> None:
         """
         Save FAISS indices and mappings to disk
         
         Args:
             save_dir: Directory to save files
+            write_json: Also write chunk_mapping.json (for debugging)
         """
         print(f"\n💾 Saving indices to: {save_dir}")
         
@@ -186,17 +468,40 @@ class VectorStore:
         
         # Save FAISS indices
         if self.text_index is not None:
-            faiss.write_index(self.text_index, os.path.join(save_dir, "text_vectors.index"))
+            _write_index(
+                self.text_index, os.path.join(save_dir, "text_vectors.index"),
+                on_gpu=self._text_on_gpu
+            )
             print(f"✅ Saved text_vectors.index")
         
         if self.image_index is not None:
-            faiss.write_index(self.image_index, os.path.join(save_dir, "image_vectors.index"))
+            _write_index(self.image_index, os.path.join(save_dir, "image_vectors.index"))
             print(f"✅ Saved image_vectors.index")
         
         # Save mappings
-        with open(os.path.join(save_dir, "chunk_mapping.json"), 'w', encoding='utf-8') as f:
-            json.dump(self.chunk_mapping, f, indent=2, ensure_ascii=False)
-        print(f"✅ Saved chunk_mapping.json")
+        table_path = os.path.join(save_dir, CHUNK_TABLE_FILE)
+        if pa is not None:
+            table = pa.table({
+                'chunk_id': pa.array(self.chunk_ids, type=pa.string()),
+                'text': pa.array(self.chunk_texts, type=pa.string()),
+                'chunk_index': pa.array(self.chunk_indices, type=pa.int32())
+            })
+            feather.write_feather(table, table_path, compression='zstd')
+            print(f"✅ Saved {CHUNK_TABLE_FILE}")
+        elif os.path.exists(table_path):
+            # Don't leave a stale table that load_indices would prefer
+            os.remove(table_path)
+        
+        if pa is None or write_json:
+            chunk_mapping = {
+                i: {'chunk_id': chunk_id, 'text': text, 'chunk_index': int(chunk_index)}
+                for i, (chunk_id, text, chunk_index) in enumerate(
+                    zip(self.chunk_ids, self.chunk_texts, self.chunk_indices)
+                )
+            }
+            with open(os.path.join(save_dir, CHUNK_MAPPING_FILE), 'w', encoding='utf-8') as f:
+                json.dump(chunk_mapping, f, indent=2, ensure_ascii=False)
+            print(f"✅ Saved {CHUNK_MAPPING_FILE}")
         
         with open(os.path.join(save_dir, "image_mapping.json"), 'w', encoding='utf-8') as f:
             json.dump(self.image_mapping, f, indent=2, ensure_ascii=False)
@@ -216,19 +521,36 @@ class VectorStore:
         # Load FAISS indices
         text_index_path = os.path.join(load_dir, "text_vectors.index")
         if os.path.exists(text_index_path):
-            self.text_index = faiss.read_index(text_index_path)
+            self.text_index = _read_index(text_index_path)
+            self._text_on_gpu = False
+            self._gpu_resources = None
+            self._apply_search_params(self.text_index)
             print(f"✅ Loaded text_vectors.index ({self.text_index.ntotal} vectors)")
         
         image_index_path = os.path.join(load_dir, "image_vectors.index")
         if os.path.exists(image_index_path):
-            self.image_index = faiss.read_index(image_index_path)
+            self.image_index = _read_index(image_index_path)
+            self._apply_search_params(self.image_index)
             print(f"✅ Loaded image_vectors.index ({self.image_index.ntotal} vectors)")
         
         # Load mappings
-        with open(os.path.join(load_dir, "chunk_mapping.json"), 'r', encoding='utf-8') as f:
-            # Convert string keys back to integers
-            self.chunk_mapping = {int(k): v for k, v in json.load(f).items()}
-        print(f"✅ Loaded chunk_mapping.json")
+        table_path = os.path.join(load_dir, CHUNK_TABLE_FILE)
+        if pa is not None and os.path.exists(table_path):
+            table = feather.read_table(table_path, memory_map=True)
+            self.chunk_ids = table.column('chunk_id').to_numpy(zero_copy_only=False)
+            self.chunk_texts = table.column('text').to_numpy(zero_copy_only=False)
+            self.chunk_indices = table.column('chunk_index').to_numpy()
+            print(f"✅ Loaded {CHUNK_TABLE_FILE}")
+        else:
+            with open(os.path.join(load_dir, CHUNK_MAPPING_FILE), 'r', encoding='utf-8') as f:
+                # Keys are index positions stored as strings
+                entries = sorted(json.load(f).items(), key=lambda item: int(item[0]))
+            self._set_chunk_columns(
+                [entry['chunk_id'] for _, entry in entries],
+                [entry['text'] for _, entry in entries],
+                [entry['chunk_index'] for _, entry in entries]
+            )
+            print(f"✅ Loaded {CHUNK_MAPPING_FILE}")
         
         with open(os.path.join(load_dir, "image_mapping.json"), 'r', encoding='utf-8') as f:
             self.image_mapping = {int(k): v for k, v in json.load(f).items()}
@@ -246,7 +568,7 @@ def main():
     # Step 1: Generate embeddings
     generator = EmbeddingGenerator()
     
-    text_embeddings, chunk_ids, chunks = generator.generate_text_embeddings(
+    text_embeddings, chunk_ids, texts, chunk_indices = generator.generate_text_embeddings(
         "data/chunks.json"
     )
     
@@ -257,7 +579,9 @@ def main():
     # Step 2: Create FAISS indices
     vector_store = VectorStore(embedding_dim=generator.embedding_dim)
     
-    vector_store.create_text_index(text_embeddings, chunk_ids, chunks)
+    vector_store.create_text_index_from_columns(
+        text_embeddings, chunk_ids, texts, chunk_indices
+    )
     vector_store.create_image_index(image_embeddings, image_ids, images)
     
     # Step 3: Test search
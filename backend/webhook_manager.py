@@ -3,12 +3,25 @@ Webhook Manager
 Handle webhooks for external integrations
 """
 
-from typing import Dict, List, Callable, Any
+from typing import Dict, List, Tuple, Callable, Any, Optional, Union
+import asyncio
 import hashlib
 import hmac
+import inspect
+import itertools
+import threading
+import time
+from collections import deque
+from itertools import islice
 from datetime import datetime
 from logger import logger
 
+# next() on itertools.count is atomic under the GIL, so ids stay unique across threads
+_event_counter = itertools.count()
+
+# Events waiting for delivery before trigger() starts dropping them
+DELIVERY_QUEUE_SIZE = 10_000
+
 
 class WebhookEvent:
     """Webhook event wrapper"""
@@ -17,9 +30,8 @@ class WebhookEvent:
         self.event_type = event_type
         self.data = data
         self.timestamp = datetime.now().isoformat()
-        self.event_id = hashlib.md5(
-            f"{event_type}{self.timestamp}".encode()
-        ).hexdigest()
+        # Microsecond clock plus a process-wide sequence number
+        self.event_id = f"{time.time_ns() // 1000:x}{next(_event_counter) & 0xFFFFFFFF:08x}"
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -36,68 +48,129 @@ class WebhookManager:
     
     def __init__(self, secret_key: str = "webhook-secret"):
         self.secret_key = secret_key
-        self.subscriptions: Dict[str, List[Callable]] = {}
-        self.webhook_history = []
+        # Tuples are replaced, never mutated, so dispatch can read them without locking
+        self.subscriptions: Dict[str, Tuple[Callable, ...]] = {}
+        self._lock = threading.Lock()
         self.max_history = 1000
+        # Oldest entries fall off automatically once max_history is reached
+        self.webhook_history = deque(maxlen=self.max_history)
+        # Delivery queue and worker are created on first use inside the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.dropped_events = 0
+    
+    @property
+    def secret_key(self) -> str:
+        """Key used to sign webhook payloads"""
+        return self._secret_key
+    
+    @secret_key.setter
+    def secret_key(self, value: str):
+        self._secret_key = value
+        # Keyed HMAC state with the pads already absorbed; copied per signature
+        self._hmac_template = hmac.new(value.encode(), digestmod=hashlib.sha256)
     
     def subscribe(self, event_type: str, callback: Callable):
         """Subscribe to webhook event"""
-        if event_type not in self.subscriptions:
-            self.subscriptions[event_type] = []
-        
-        self.subscriptions[event_type].append(callback)
+        with self._lock:
+            self.subscriptions[event_type] = self.subscriptions.get(event_type, ()) + (callback,)
         logger.info(f"Webhook subscribed: {event_type}")
     
     def unsubscribe(self, event_type: str, callback: Callable):
         """Unsubscribe from webhook event"""
-        if event_type in self.subscriptions:
-            self.subscriptions[event_type] = [
+        with self._lock:
+            if event_type not in self.subscriptions:
+                return
+            self.subscriptions[event_type] = tuple(
                 cb for cb in self.subscriptions[event_type]
                 if cb != callback
-            ]
-            logger.info(f"Webhook unsubscribed: {event_type}")
+            )
+        logger.info(f"Webhook unsubscribed: {event_type}")
     
     async def trigger(self, event: WebhookEvent):
-        """Trigger webhook event"""
+        """Queue webhook event for background delivery"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=DELIVERY_QUEUE_SIZE)
+            self._worker = asyncio.create_task(self._deliver_events())
+        
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            logger.warning(f"Webhook queue full, dropped event: {event.event_type}")
+            return
+        
         self.webhook_history.append(event.to_dict())
+    
+    async def flush(self):
+        """Wait until every queued event has been delivered"""
+        if self._queue is not None:
+            await self._queue.join()
+    
+    async def _deliver_events(self):
+        """Background task delivering queued events to subscribers"""
+        queue = self._queue
+        while True:
+            event = await queue.get()
+            try:
+                await self._dispatch(event)
+            finally:
+                queue.task_done()
+    
+    async def _dispatch(self, event: WebhookEvent):
+        """Run every subscriber of an event"""
+        callbacks = self.subscriptions.get(event.event_type)
+        if not callbacks:
+            return
         
-        if len(self.webhook_history) > self.max_history:
-            self.webhook_history.pop(0)
+        # Subscribers are independent, so run them concurrently
+        results = await asyncio.gather(
+            *(self._run_callback(callback, event) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Webhook callback error: {str(result)}")
+    
+    @staticmethod
+    async def _run_callback(callback: Callable, event: WebhookEvent):
+        """Await async callbacks; run sync ones in the default executor"""
+        if inspect.iscoroutinefunction(callback):
+            await callback(event)
+            return
         
-        if event.event_type in self.subscriptions:
-            for callback in self.subscriptions[event.event_type]:
-                try:
-                    if hasattr(callback, '__call__'):
-                        result = callback(event)
-                        if hasattr(result, '__await__'):
-                            await result
-                except Exception as e:
-                    logger.error(f"Webhook callback error: {str(e)}")
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, callback, event)
+        if inspect.isawaitable(result):
+            await result
     
-    def generate_signature(self, payload: str) -> str:
+    def generate_signature(self, payload: Union[bytes, str]) -> str:
         """Generate webhook signature"""
-        return hmac.new(
-            self.secret_key.encode(),
-            payload.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        # Raw request bodies are signed as-is; str is still accepted for older callers
+        if isinstance(payload, str):
+            payload = payload.encode()
+        mac = self._hmac_template.copy()
+        mac.update(payload)
+        return mac.hexdigest()
     
-    def verify_signature(self, payload: str, signature: str) -> bool:
+    def verify_signature(self, payload: Union[bytes, str], signature: str) -> bool:
         """Verify webhook signature"""
         expected = self.generate_signature(payload)
         return hmac.compare_digest(expected, signature)
     
     def get_history(self, event_type: str = None, limit: int = 100) -> List[Dict]:
         """Get webhook history"""
-        history = self.webhook_history
+        if limit <= 0:
+            return []
         
+        history = reversed(self.webhook_history)
         if event_type:
-            history = [
-                e for e in history
-                if e["event_type"] == event_type
-            ]
+            history = (e for e in history if e["event_type"] == event_type)
         
-        return history[-limit:]
+        # Walk back from the newest entry and stop once limit are collected
+        recent = list(islice(history, limit))
+        recent.reverse()
+        return recent
 
 
 # Global webhook manager